@@ -9,73 +9,181 @@ read from installed package metadata, with a fallback that parses
 ``pyproject.toml`` for unbuilt source checkouts.
 """
 
-from importlib.metadata import PackageNotFoundError, version as _pkg_version
-
-from .core import create_presentation
-from .loader import (
-    load_deck_mapping,
-    load_verses_from_file,
-    load_verses_from_dict,
-    write_deck_mapping,
-)
-from .template_resolver import list_templates, resolve_template_style, get_template_path
-from .slide_renderers import register_renderer, list_renderers
-from .pdf_converter import convert_pptx_to_pdf, PDFOptions, PDFConverter
-from .slide_images import (
-    SlideImageOptions,
-    default_slide_images_dir,
-    export_pptx_slide_jpegs,
-    resolve_slide_images_dir,
-)
-from .video_exporter import VideoOptions, convert_pptx_to_video, convert_deck_to_video, resolve_video_backend
-from .video_sidecar import load_deck_sidecar
+import os
+from typing import TYPE_CHECKING
+
 from .lazy_loader import lazy_import, check_optional_dependency, LazyImportError
-from .config import load_config, init_config, Config
-from .pptx_to_json import pptx_to_json
-from .deck_export import deck_to_markdown, write_deck_markdown
-# Note: gdrive_uploader uses lazy_import internally so importing the module
-# (not the optional google-* deps) is always safe.
-from .gdrive_uploader import upload_to_gdrive, is_gdrive_available, GDriveUploader
 from .exceptions import (
     PraisonAIPPTError,
     LoaderError,
     SchemaError,
     BackendUnavailableError,
 )
-from .utils import resolve_asset_path
-from .avatar_calibrate import (
-    AvatarFramingResult,
-    calibrate_avatar_framing,
-    calibrate_deck_avatars,
-    maybe_auto_calibrate_deck,
-)
-from .hero_panel_calibrate import (
-    HeroPanelResult,
-    HeroTextConfig,
-    calibrate_deck_hero_panels,
-    calibrate_hero_panel,
-    format_hero_panel_report,
-    hero_text_deps_hint,
-    maybe_auto_place_hero_text_deck,
-)
-from .slide_transition import (
-    SlideTransitionConfig,
-    format_transition_report,
-    maybe_apply_slide_transitions_deck,
-)
-from .transition_backends import list_transition_backends
-from .video_protocol import TransitionDefaults, resolve_edge_transitions
-from .hero_panel_measure import (
-    HeroPanelMetrics,
-    format_hero_panel_measure_report,
-    measure_hero_panel_image,
-    panel_clearance_score,
-    placement_advice,
-    save_hero_panel_validation_diagram,
-)
+# Bound eagerly: the function shares its submodule's name, so a lazy binding
+# would be replaced by the module as soon as ``praisonaippt.pptx_to_json`` is
+# imported. The submodule only needs the stdlib at import time.
+from .pptx_to_json import pptx_to_json
+
+# Everything else is imported from its submodule on first attribute access
+# (PEP 562), so ``import praisonaippt`` does not pull in python-pptx, Pillow,
+# PyYAML, the Drive uploader or package metadata until they are needed.
+_LAZY_SUBMODULES = {
+    "core": ("create_presentation", "create_presentations"),
+    "loader": (
+        "load_deck_mapping",
+        "load_verses_from_file",
+        "load_verses_from_dict",
+        "write_deck_mapping",
+    ),
+    "template_resolver": ("list_templates", "resolve_template_style", "get_template_path"),
+    "slide_renderers": ("register_renderer", "list_renderers"),
+    "pdf_converter": ("convert_pptx_to_pdf", "PDFOptions", "PDFConverter"),
+    "slide_images": (
+        "SlideImageOptions",
+        "default_slide_images_dir",
+        "export_pptx_slide_jpegs",
+        "resolve_slide_images_dir",
+    ),
+    "video_exporter": (
+        "VideoOptions",
+        "convert_pptx_to_video",
+        "convert_deck_to_video",
+        "resolve_video_backend",
+    ),
+    "video_sidecar": ("load_deck_sidecar",),
+    "config": ("load_config", "init_config", "Config"),
+    "deck_export": ("deck_to_markdown", "write_deck_markdown"),
+    # Only the module is deferred; the google-* deps load on first upload.
+    "gdrive_uploader": ("upload_to_gdrive", "is_gdrive_available", "GDriveUploader"),
+    "utils": ("resolve_asset_path",),
+    "avatar_calibrate": (
+        "AvatarFramingResult",
+        "calibrate_avatar_framing",
+        "calibrate_deck_avatars",
+        "maybe_auto_calibrate_deck",
+    ),
+    "hero_panel_calibrate": (
+        "HeroPanelResult",
+        "HeroTextConfig",
+        "calibrate_deck_hero_panels",
+        "calibrate_hero_panel",
+        "format_hero_panel_report",
+        "hero_text_deps_hint",
+        "maybe_auto_place_hero_text_deck",
+    ),
+    "slide_transition": (
+        "SlideTransitionConfig",
+        "format_transition_report",
+        "maybe_apply_slide_transitions_deck",
+    ),
+    "transition_backends": ("list_transition_backends",),
+    "video_protocol": ("TransitionDefaults", "resolve_edge_transitions"),
+    "hero_panel_measure": (
+        "HeroPanelMetrics",
+        "format_hero_panel_measure_report",
+        "measure_hero_panel_image",
+        "panel_clearance_score",
+        "placement_advice",
+        "save_hero_panel_validation_diagram",
+    ),
+}
+_LAZY_EXPORTS = {
+    name: module for module, names in _LAZY_SUBMODULES.items() for name in names
+}
+
+if TYPE_CHECKING:  # pragma: no cover - lets IDEs and type checkers see lazy names
+    from .core import create_presentation, create_presentations
+    from .loader import (
+        load_deck_mapping,
+        load_verses_from_file,
+        load_verses_from_dict,
+        write_deck_mapping,
+    )
+    from .template_resolver import list_templates, resolve_template_style, get_template_path
+    from .slide_renderers import register_renderer, list_renderers
+    from .pdf_converter import convert_pptx_to_pdf, PDFOptions, PDFConverter
+    from .slide_images import (
+        SlideImageOptions,
+        default_slide_images_dir,
+        export_pptx_slide_jpegs,
+        resolve_slide_images_dir,
+    )
+    from .video_exporter import (
+        VideoOptions,
+        convert_pptx_to_video,
+        convert_deck_to_video,
+        resolve_video_backend,
+    )
+    from .video_sidecar import load_deck_sidecar
+    from .config import load_config, init_config, Config
+    from .deck_export import deck_to_markdown, write_deck_markdown
+    from .gdrive_uploader import upload_to_gdrive, is_gdrive_available, GDriveUploader
+    from .utils import resolve_asset_path
+    from .avatar_calibrate import (
+        AvatarFramingResult,
+        calibrate_avatar_framing,
+        calibrate_deck_avatars,
+        maybe_auto_calibrate_deck,
+    )
+    from .hero_panel_calibrate import (
+        HeroPanelResult,
+        HeroTextConfig,
+        calibrate_deck_hero_panels,
+        calibrate_hero_panel,
+        format_hero_panel_report,
+        hero_text_deps_hint,
+        maybe_auto_place_hero_text_deck,
+    )
+    from .slide_transition import (
+        SlideTransitionConfig,
+        format_transition_report,
+        maybe_apply_slide_transitions_deck,
+    )
+    from .transition_backends import list_transition_backends
+    from .video_protocol import TransitionDefaults, resolve_edge_transitions
+    from .hero_panel_measure import (
+        HeroPanelMetrics,
+        format_hero_panel_measure_report,
+        measure_hero_panel_image,
+        panel_clearance_score,
+        placement_advice,
+        save_hero_panel_validation_diagram,
+    )
+
+    __version__: str
+
+
+def __getattr__(name):
+    if name == "__version__":
+        value = _read_version()
+    else:
+        module_name = _LAZY_EXPORTS.get(name)
+        if module_name is None:
+            raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+        from importlib import import_module
+
+        value = getattr(import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_EXPORTS) | {"__version__"})
+
+
+def _resolve_lazy_exports() -> None:
+    """Import every lazy export (and the Drive deps, if installed) right away."""
+    for name in _LAZY_EXPORTS:
+        __getattr__(name)
+    from .gdrive_uploader import is_gdrive_available, preload_gdrive_modules
+
+    if is_gdrive_available():
+        preload_gdrive_modules()
 
 
 def _read_version() -> str:
+    from importlib.metadata import PackageNotFoundError, version as _pkg_version
+
     try:
         return _pkg_version("praisonaippt")
     except PackageNotFoundError:
@@ -92,12 +200,12 @@ def _read_version() -> str:
             return "0.0.0"
 
 
-__version__ = _read_version()
 __author__ = "MervinPraison"
 __license__ = "MIT"
 
 __all__ = [
     "create_presentation",
+    "create_presentations",
     "load_deck_mapping",
     "load_verses_from_file",
     "load_verses_from_dict",
@@ -160,3 +268,8 @@ __all__ = [
     "TransitionDefaults",
     "resolve_edge_transitions",
 ]
+
+# PRAISONAIPPT_EAGER_IMPORT=1 (e.g. in CI) surfaces broken lazy exports or a
+# partial [gdrive] install at import time rather than at first use.
+if os.environ.get("PRAISONAIPPT_EAGER_IMPORT") == "1":
+    _resolve_lazy_exports()
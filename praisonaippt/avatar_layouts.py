@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import base64
 import io
+import logging
 import os
 import subprocess
 import tempfile
@@ -19,6 +20,8 @@ from .layout_tokens import layout_in, typography_pt
 from .text_panel_anchors import HERO_PANEL_ANCHORS, TEXT_PANEL_ANCHORS
 from .utils import resolve_asset_path
 
+logger = logging.getLogger(__name__)
+
 AVATAR_SLIDE_TYPES = (
     "avatar_only",
     "media_only",
@@ -940,7 +943,7 @@ def _place_media_in_box(
     resolved = resolve_asset_path(media_path, source_file=source_file)
     path = resolved if resolved else media_path
     if not path or not os.path.isfile(path):
-        print(f"Warning: Media not found: {media_path}")
+        logger.warning("Media not found: %s", media_path)
         _place_empty_region(slide, box, "media")
         return
     if _is_video_path(path):
@@ -1020,7 +1023,7 @@ def _place_avatar_in_box(
     resolved = resolve_asset_path(avatar_path, source_file=source_file)
     path = resolved if resolved else avatar_path
     if not path or not os.path.isfile(path):
-        print(f"Warning: Avatar video not found: {avatar_path}")
+        logger.warning("Avatar video not found: %s", avatar_path)
         _place_empty_region(slide, box, "avatar")
         return
     poster = _poster_bytes(poster_path, source_file)
@@ -1329,12 +1332,12 @@ def _render_avatar_quote(slide, prs, verse: dict, style: dict, regions: dict, th
 
 def render_avatar_slide(prs, kind: str, verse: dict, style=None, *, source_file: Optional[str] = None):
     """Build one avatar layout slide."""
-    from .core import _apply_slide_background, _resolve_theme
+    from .core import _add_blank_slide, _apply_slide_background, _resolve_theme
 
     style = dict(style or {})
     if source_file:
         style["_source_file"] = source_file
-    slide = prs.slides.add_slide(prs.slide_layouts[6])
+    slide = _add_blank_slide(prs)
     if kind not in ("avatar_quote", "avatar_intro"):
         _apply_slide_background(slide, style, prs)
     theme = _resolve_theme(style)
@@ -8,7 +8,7 @@ import logging
 import sys
 import json
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import TYPE_CHECKING, Optional, Tuple
 from . import __version__
 from .exceptions import SchemaError
 from .loader import (
@@ -20,10 +20,8 @@ from .loader import (
 )
 from .template_resolver import list_templates, resolve_template_style
 from .schema import validate_verses
-from .core import create_presentation
 from .list_slides import print_slide_outline
 from .pdf_converter import PDFOptions, convert_pptx_to_pdf
-from .video_exporter import VideoOptions, convert_pptx_to_video, convert_deck_to_video, resolve_video_backend
 from .video_sidecar import load_deck_sidecar
 from .slide_images import (
     SlideImageOptions,
@@ -34,6 +32,9 @@ from .slide_images import (
 from .ffmpeg_composer import check_video_tools, print_tool_check_report, pick_video_encoder
 from .config import load_config, init_config
 
+if TYPE_CHECKING:
+    from .video_exporter import VideoOptions
+
 
 def _verse_from_plan_entry(entry: dict) -> dict:
     """Return the content verse from an ``iter_slide_plan`` yield."""
@@ -599,8 +600,10 @@ def parse_pdf_options(options_str: str) -> PDFOptions:
         raise ValueError(f"Invalid PDF options: {e}")
 
 
-def parse_video_options(args, data: Optional[dict] = None) -> VideoOptions:
+def parse_video_options(args, data: Optional[dict] = None) -> "VideoOptions":
     """Build VideoOptions from CLI flags, optional JSON, and deck YAML."""
+    from .video_exporter import VideoOptions
+
     opts = VideoOptions()
     if data and data.get("video_export"):
         opts = VideoOptions.from_dict(data["video_export"], data)
@@ -669,6 +672,7 @@ def handle_build_slide_images_command(args) -> int:
     data["_source_file"] = str(deck.resolve())
 
     from .avatar_calibrate import maybe_auto_calibrate_deck
+    from .core import create_presentation
     from .hero_panel_calibrate import maybe_auto_place_hero_text_deck
 
     data = maybe_auto_calibrate_deck(data, source_file=data["_source_file"])
@@ -1643,6 +1647,8 @@ def handle_convert_video_command(args, data: Optional[dict] = None):
             video_path = opts.output_path or str(Path(args.input_file).with_suffix(".mp4"))
 
         print(f"Converting {args.input_file} to video...")
+        from .video_exporter import convert_pptx_to_video
+
         result = convert_pptx_to_video(
             args.input_file,
             video_path,
@@ -2701,6 +2707,8 @@ def main():
         args.upload_gdrive = True
     
     # Create presentation
+    from .core import create_presentation
+
     output_file = create_presentation(
         data,
         output_file=args.output,
@@ -2770,6 +2778,8 @@ def main():
             else:
                 video_path = opts.output_path or str(Path(output_file).with_suffix(".mp4"))
             print("Converting to video...")
+            from .video_exporter import convert_deck_to_video
+
             result = convert_deck_to_video(
                 data,
                 output_file,
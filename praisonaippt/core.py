@@ -2,10 +2,25 @@
 Core presentation creation logic for Bible verses PowerPoint generator.
 """
 
+import copy
+import functools
+import logging
+import os
+import re
+import secrets
+import stat
+import weakref
+import zipfile
+
 from pptx import Presentation
 from pptx.util import Inches, Pt
 from pptx.dml.color import RGBColor
-from pptx.enum.text import PP_ALIGN, MSO_ANCHOR
+from pptx.enum.text import PP_ALIGN, MSO_ANCHOR, MSO_UNDERLINE
+from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+from pptx.opc.package import OpcPackage
+from pptx.opc.packuri import PackURI
+from pptx.opc import serialized as _opc_serialized
+from pptx.util import lazyproperty
 from .utils import split_long_text, sanitize_filename, resolve_asset_path
 from .pdf_converter import PDFOptions, convert_pptx_to_pdf
 from .layout_tokens import (
@@ -16,6 +31,186 @@ from .layout_tokens import (
     split_max_length_default,
 )
 
+logger = logging.getLogger(__name__)
+
+try:  # Optional C Aho-Corasick automaton for large highlight sets.
+    import ahocorasick as _ahocorasick
+except ImportError:  # pragma: no cover - depends on the [fast-highlights] extra
+    _ahocorasick = None
+
+# Below this many phrases the compiled regex alternation is as fast.
+AHOCORASICK_MIN_PHRASES = 8
+
+
+# package -> {partname template: last issued sequence number}
+_PARTNAME_COUNTERS = weakref.WeakKeyDictionary()
+
+
+def _install_partname_counter():
+    """
+    Make ``OpcPackage.next_partname`` amortised O(1) per package and template.
+
+    python-pptx rescans every part in the package on each call, which makes
+    adding N notes slides O(N^2). The first call per template finds the
+    highest sequence number in use; later calls increment a cached counter.
+    """
+    original = OpcPackage.next_partname
+    if getattr(original, "_praisonaippt_counter", False):
+        return
+
+    @functools.wraps(original)
+    def next_partname(self, tmpl):
+        if tmpl.count("%d") != 1:
+            return original(self, tmpl)
+        counters = _PARTNAME_COUNTERS.setdefault(self, {})
+        n = counters.get(tmpl)
+        if n is None:
+            prefix, suffix = tmpl.split("%d")
+            n = 0
+            for part in self.iter_parts():
+                name = str(part.partname)
+                if name.startswith(prefix) and name.endswith(suffix):
+                    digits = name[len(prefix):len(name) - len(suffix)]
+                    if digits.isdigit():
+                        n = max(n, int(digits))
+        counters[tmpl] = n + 1
+        return PackURI(tmpl % (n + 1))
+
+    next_partname._praisonaippt_counter = True
+    OpcPackage.next_partname = next_partname
+
+
+_install_partname_counter()
+
+# Deflate level for slide XML: level 1 is several times faster than the
+# zlib default (6) and only slightly larger for repetitive DrawingML.
+PPTX_ZIP_COMPRESSLEVEL = 1
+# Write buffer for the output .pptx file.
+PPTX_SAVE_BUFFER_SIZE = 4 << 20
+# Media that is already compressed is stored, not deflated again.
+_PRECOMPRESSED_MEDIA = (
+    '.jpg', '.jpeg', '.png', '.gif', '.webp', '.mp4', '.m4v', '.mov', '.mp3', '.m4a',
+)
+
+
+def _install_fast_zip_writer():
+    """
+    Tune python-pptx's zip writer: fast deflate for XML, STORED for media.
+
+    Only applies to python-pptx versions whose ``_ZipPkgWriter`` opens its
+    ``ZipFile`` lazily (1.0+); older versions keep their default settings.
+    """
+    writer_cls = getattr(_opc_serialized, "_ZipPkgWriter", None)
+    if writer_cls is None or getattr(writer_cls, "_praisonaippt_fast", False):
+        return
+    if not isinstance(writer_cls.__dict__.get("_zipf"), lazyproperty):
+        return
+
+    def _zipf(self):
+        return zipfile.ZipFile(
+            self._pkg_file, "w", compression=zipfile.ZIP_DEFLATED,
+            compresslevel=PPTX_ZIP_COMPRESSLEVEL, strict_timestamps=False,
+        )
+
+    def write(self, pack_uri, blob):
+        member = pack_uri.membername
+        compress_type = None
+        if member.startswith("ppt/media/") and member.lower().endswith(_PRECOMPRESSED_MEDIA):
+            compress_type = zipfile.ZIP_STORED
+        self._zipf.writestr(member, blob, compress_type=compress_type)
+
+    writer_cls._zipf = lazyproperty(_zipf)
+    writer_cls.write = write
+    writer_cls._praisonaippt_fast = True
+
+
+_install_fast_zip_writer()
+
+
+def _open_save_temp(output_file):
+    """Create and open a uniquely named temp file beside ``output_file``."""
+    base = os.path.join(
+        os.path.dirname(output_file) or ".", f".{os.path.basename(output_file)}."
+    )
+    while True:
+        tmp_file = f"{base}{secrets.token_hex(4)}.tmp"
+        try:
+            # "x" refuses to reuse a name; the kernel applies the umask.
+            return tmp_file, open(tmp_file, "xb", buffering=PPTX_SAVE_BUFFER_SIZE)
+        except FileExistsError:
+            continue
+
+
+def _save_presentation(prs, output_file):
+    """
+    Save ``prs`` to ``output_file`` through a large write buffer.
+
+    The deck is written to a uniquely named temp file beside ``output_file``
+    and moved into place with ``os.replace``, so readers never see a
+    partially written file and concurrent saves to one path do not collide.
+    An existing target keeps its permission bits; a new one gets the umask
+    default, as with a plain ``open``. Unlike ``prs.save(path)``, a symlinked
+    ``output_file`` is replaced by a regular file rather than written through.
+    """
+    tmp_file, f = _open_save_temp(output_file)
+    try:
+        with f:
+            prs.save(f)
+        try:
+            os.chmod(tmp_file, stat.S_IMODE(os.stat(output_file).st_mode))
+        except FileNotFoundError:
+            pass
+        os.replace(tmp_file, output_file)
+    except BaseException:
+        try:
+            os.remove(tmp_file)
+        except OSError:
+            pass
+        raise
+
+
+# package -> blank slide layout (index 6 of the default template)
+_BLANK_LAYOUTS = weakref.WeakKeyDictionary()
+
+# package -> {(image path, width, height): (image part, template <p:pic>)}
+_BACKGROUND_TEMPLATES = weakref.WeakKeyDictionary()
+
+
+def _add_blank_slide(prs):
+    """Append a slide using the blank layout, resolved once per presentation."""
+    package = prs.part.package
+    layout = _BLANK_LAYOUTS.get(package)
+    if layout is None:
+        layout = _BLANK_LAYOUTS[package] = prs.slide_layouts[6]
+    return prs.slides.add_slide(layout)
+
+
+def _add_background_picture(slide, img_path, w, h):
+    """
+    Add a full-bleed picture behind every other shape on ``slide``.
+
+    The first slide of a presentation goes through ``add_picture``; later
+    slides with the same image and size deep-copy that ``<p:pic>`` and relate
+    the existing image part, skipping the per-slide file read and SHA1 hash.
+    """
+    sp_tree = slide.shapes._spTree
+    cache = _BACKGROUND_TEMPLATES.setdefault(slide.part.package, {})
+    key = (img_path, int(w), int(h))
+    if key not in cache:
+        pic_el = slide.shapes.add_picture(img_path, 0, 0, w, h)._element
+        cache[key] = (slide.part.related_part(pic_el.blip_rId), copy.deepcopy(pic_el))
+    else:
+        image_part, template = cache[key]
+        pic_el = copy.deepcopy(template)
+        shape_id = slide.shapes._next_shape_id
+        pic_el.nvPicPr.cNvPr.id = shape_id
+        pic_el.nvPicPr.cNvPr.name = f"Picture {shape_id - 1}"
+        pic_el.blipFill.blip.rEmbed = slide.part.relate_to(image_part, RT.IMAGE)
+    # Move picture to back
+    if pic_el.getparent() is sp_tree:
+        sp_tree.remove(pic_el)
+    sp_tree.insert(2, pic_el)
+
 
 def _apply_slide_background(slide, style: dict, prs=None):
     """
@@ -42,11 +237,7 @@ def _apply_slide_background(slide, style: dict, prs=None):
                 w, h = prs.slide_width, prs.slide_height
             else:
                 w, h = Inches(13.33), Inches(7.5)
-            pic = slide.shapes.add_picture(img_path, 0, 0, w, h)
-            # Move picture to back
-            sp_tree = slide.shapes._spTree
-            sp_tree.remove(pic._element)
-            sp_tree.insert(2, pic._element)
+            _add_background_picture(slide, img_path, w, h)
         elif bg_color:
             img_path = None
     if not img_path and bg_color:
@@ -114,7 +305,7 @@ def add_title_only_slide(prs, title, subtitle=None, style=None, font_size=None):
     """Title-only slide (PowerPoint Title Only / Google TITLE_ONLY)."""
     style = style or {}
     theme = _resolve_theme(style)
-    slide = prs.slides.add_slide(prs.slide_layouts[6])
+    slide = _add_blank_slide(prs)
     _apply_slide_background(slide, style, prs)
     title_pt = int(font_size or typography_pt(style, "title_size_pt", 44))
     left, width, width_in, _ = content_box(prs, style, "title_only")
@@ -160,7 +351,7 @@ def add_two_column_slide(prs, left_text, right_text, style=None, font_size=28,
     """Two Content layout — side-by-side body columns."""
     style = style or {}
     theme = _resolve_theme(style)
-    slide = prs.slides.add_slide(prs.slide_layouts[6])
+    slide = _add_blank_slide(prs)
     _apply_slide_background(slide, style, prs)
     lx, rx, col_w, top_in, height_in, _ = _two_column_layout(prs, style, "two_column")
     for x_in, text, hl in (
@@ -180,7 +371,7 @@ def add_comparison_slide(prs, columns, style=None, font_size=28, alignment="left
     """Comparison layout — heading + body per column."""
     style = style or {}
     theme = _resolve_theme(style)
-    slide = prs.slides.add_slide(prs.slide_layouts[6])
+    slide = _add_blank_slide(prs)
     _apply_slide_background(slide, style, prs)
     lx, rx, col_w, _, height_in, _ = _two_column_layout(prs, style, "comparison")
     top_in = float(layout_in(style, "comparison", "top_in", 0.75))
@@ -240,7 +431,7 @@ def add_big_number_slide(prs, number, label, style=None, reference=None):
     """Big Number layout (Google Slides BIG_NUMBER)."""
     style = style or {}
     theme = _resolve_theme(style)
-    slide = prs.slides.add_slide(prs.slide_layouts[6])
+    slide = _add_blank_slide(prs)
     _apply_slide_background(slide, style, prs)
     num_pt = int(typography_pt(style, "big_number_size_pt", 120))
     label_pt = int(typography_pt(style, "big_number_label_size_pt", 32))
@@ -293,7 +484,7 @@ def add_quote_slide(prs, text, style=None, reference=None, font_size=None, align
     """Centred pull-quote slide."""
     style = style or {}
     theme = _resolve_theme(style)
-    slide = prs.slides.add_slide(prs.slide_layouts[6])
+    slide = _add_blank_slide(prs)
     _apply_slide_background(slide, style, prs)
     from .layout_tokens import pip_top_inches
 
@@ -336,7 +527,7 @@ def add_picture_text_slide(prs, image_path, text, style=None, image_side="left",
     style = dict(style or {})
     if source_file:
         style["_source_file"] = source_file
-    slide = prs.slides.add_slide(prs.slide_layouts[6])
+    slide = _add_blank_slide(prs)
     _apply_slide_background(slide, style, prs)
     theme = _resolve_theme(style)
     margin_in = float(layout_in(style, "picture_text", "margin_in", 0.35))
@@ -366,7 +557,7 @@ def add_picture_text_slide(prs, image_path, text, style=None, image_side="left",
             pic = slide.shapes.add_picture(path, img_left, margin, width=img_w)
             _fit_picture_in_box(pic, img_left, margin, img_w, content_h, fit)
     else:
-        print(f"Warning: Image not found: {image_path}")
+        logger.warning("Image not found: %s", image_path)
     align = _resolve_alignment(alignment)
     tb = slide.shapes.add_textbox(txt_left, margin, txt_w, content_h)
     tf = tb.text_frame
@@ -449,7 +640,7 @@ def add_table_slide(prs, rows, style=None, font_size=24, header_row=True, refere
         rows = [[" "]]
     row_count = len(rows)
     col_count = max(len(r) for r in rows)
-    slide = prs.slides.add_slide(prs.slide_layouts[6])
+    slide = _add_blank_slide(prs)
     _apply_slide_background(slide, style, prs)
     from .layout_tokens import pip_top_inches
 
@@ -591,7 +782,7 @@ def add_title_slide(prs, title, subtitle="", style=None):
     """Add a title slide with centred title and subtitle (blank layout, not template placeholders)."""
     style = style or {}
     theme = _resolve_theme(style)
-    slide = prs.slides.add_slide(prs.slide_layouts[6])  # blank — avoids left-biased layout 0
+    slide = _add_blank_slide(prs)  # blank — avoids left-biased layout 0
     _apply_slide_background(slide, style, prs)
     _render_title_textboxes(slide, prs, title, subtitle, style, theme)
     return slide
@@ -608,7 +799,7 @@ def add_section_slide(prs, section_name, style=None, section_subtitle=None):
     style = style or {}
     theme = _resolve_theme(style)
 
-    slide = prs.slides.add_slide(prs.slide_layouts[6])  # blank for full control
+    slide = _add_blank_slide(prs)  # blank for full control
     _apply_slide_background(slide, style, prs)
 
     name = section_name or ''
@@ -659,32 +850,45 @@ def add_section_slide(prs, section_name, style=None, section_subtitle=None):
     return slide
 
 
+# RGBColor is an immutable tuple, so colour constants are shared across slides.
+_NAMED_COLORS = {
+    'orange': RGBColor(255, 140, 0),
+    'yellow': RGBColor(255, 215, 0),
+    'red':    RGBColor(220, 50,  50),
+    'green':  RGBColor(50,  180, 50),
+    'blue':   RGBColor(30,  100, 220),
+    'white':  RGBColor(255, 255, 255),
+    'cyan':   RGBColor(0,   200, 200),
+    'purple': RGBColor(150, 50,  200),
+}
+_DEFAULT_BODY_RGB = RGBColor(26, 26, 46)
+_DEFAULT_ANNOTATION_RGB = RGBColor(30, 80, 200)
+_ANNOTATION_BUBBLES = {1: '\u2776', 2: '\u2777', 3: '\u2778', 4: '\u2779', 5: '\u277a',
+                       6: '\u277b', 7: '\u277c', 8: '\u277d', 9: '\u277e'}
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_color_str(color_value):
+    if color_value.lower() in _NAMED_COLORS:
+        return _NAMED_COLORS[color_value.lower()]
+    # Hex string e.g. "#FF8C00" or "FF8C00"
+    lower = color_value.strip('#')
+    if len(lower) == 6:
+        try:
+            r, g, b = int(lower[0:2], 16), int(lower[2:4], 16), int(lower[4:6], 16)
+            return RGBColor(r, g, b)
+        except ValueError:
+            pass
+    return _NAMED_COLORS['orange']
+
+
 def _parse_color(color_value):
     """Parse a color value (named string or hex) into RGBColor."""
-    NAMED_COLORS = {
-        'orange': RGBColor(255, 140, 0),
-        'yellow': RGBColor(255, 215, 0),
-        'red':    RGBColor(220, 50,  50),
-        'green':  RGBColor(50,  180, 50),
-        'blue':   RGBColor(30,  100, 220),
-        'white':  RGBColor(255, 255, 255),
-        'cyan':   RGBColor(0,   200, 200),
-        'purple': RGBColor(150, 50,  200),
-    }
     if not color_value:
-        return NAMED_COLORS['orange']
+        return _NAMED_COLORS['orange']
     if isinstance(color_value, str):
-        if color_value.lower() in NAMED_COLORS:
-            return NAMED_COLORS[color_value.lower()]
-        # Hex string e.g. "#FF8C00" or "FF8C00"
-        lower = color_value.strip('#')
-        if len(lower) == 6:
-            try:
-                r, g, b = int(lower[0:2], 16), int(lower[2:4], 16), int(lower[4:6], 16)
-                return RGBColor(r, g, b)
-            except ValueError:
-                pass
-    return NAMED_COLORS['orange']
+        return _parse_color_str(color_value)
+    return _NAMED_COLORS['orange']
 
 
 def _resolve_theme(style: dict) -> dict:
@@ -731,9 +935,7 @@ def _normalise_highlights(highlights, highlight_rgb=None):
     """
     Normalise highlights list. highlight_rgb overrides the default orange.
     """
-    default_hl = highlight_rgb or RGBColor(255, 140, 0)
-    BUBBLES = {1: '\u2776', 2: '\u2777', 3: '\u2778', 4: '\u2779', 5: '\u277a',
-                6: '\u277b', 7: '\u277c', 8: '\u277d', 9: '\u277e'}
+    default_hl = highlight_rgb or _NAMED_COLORS['orange']
     result = []
     for h in highlights:
         if isinstance(h, str):
@@ -745,7 +947,7 @@ def _normalise_highlights(highlights, highlight_rgb=None):
             if ann is None:
                 ann_display = None
             elif isinstance(ann, int):
-                ann_display = BUBBLES.get(ann)
+                ann_display = _ANNOTATION_BUBBLES.get(ann)
             else:
                 ann_display = str(ann)
             result.append({
@@ -759,6 +961,82 @@ def _normalise_highlights(highlights, highlight_rgb=None):
     return result
 
 
+@functools.lru_cache(maxsize=128)
+def _phrase_pattern(phrases):
+    """
+    Compile one case-insensitive alternation for a tuple of phrases.
+
+    Each phrase is its own capture group, so ``match.lastindex - 1`` indexes the
+    phrase that matched. Alternatives keep list order: when two phrases start at
+    the same position the earlier one wins.
+    """
+    return re.compile('|'.join(f'({re.escape(p)})' for p in phrases), re.IGNORECASE)
+
+
+@functools.lru_cache(maxsize=128)
+def _phrase_automaton(phrases):
+    """Build a lower-cased Aho-Corasick automaton mapping phrase -> (index, length)."""
+    automaton = _ahocorasick.Automaton()
+    for idx, phrase in enumerate(phrases):
+        key = phrase.lower()
+        if key not in automaton:  # first listed phrase wins, as in the regex
+            automaton.add_word(key, (idx, len(key)))
+    automaton.make_automaton()
+    return automaton
+
+
+def _find_phrase_spans(text, phrases):
+    """
+    Yield ``(start, end, phrase_index)`` for leftmost non-overlapping matches.
+
+    Uses one Aho-Corasick pass when ``pyahocorasick`` is installed and the set
+    is large, else :func:`_phrase_pattern`. Both paths pick the earlier phrase
+    when two matches start at the same position.
+    """
+    folded = text.lower()
+    if (_ahocorasick is not None and len(phrases) >= AHOCORASICK_MIN_PHRASES
+            and len(folded) == len(text)):
+        hits = sorted(
+            (end - length + 1, idx, end + 1)
+            for end, (idx, length) in _phrase_automaton(phrases).iter(folded)
+        )
+        last_end = -1
+        for start, idx, end in hits:
+            if start >= last_end:
+                yield start, end, idx
+                last_end = end
+        return
+    for match in _phrase_pattern(phrases).finditer(text):
+        yield match.start(), match.end(), match.lastindex - 1
+
+
+def _append_run(p_elem, text, size_pt, rgb, font_name=None, bold=None,
+                italic=None, underline=None, baseline=None):
+    """
+    Append a formatted ``<a:r>`` to a ``<a:p>`` element without the ``_Run``/``Font`` proxies.
+
+    Produces the same XML as ``paragraph.add_run()`` followed by the equivalent
+    ``run.font`` assignments; ``None`` leaves an attribute unset.
+    """
+    r = p_elem.add_r()
+    r.text = text
+    rPr = r.get_or_add_rPr()
+    rPr.sz = Pt(size_pt).centipoints
+    rPr.b = bold
+    rPr.i = italic
+    if underline is True:
+        underline = MSO_UNDERLINE.SINGLE_LINE
+    elif underline is False:
+        underline = MSO_UNDERLINE.NONE
+    rPr.u = underline
+    if baseline is not None:
+        rPr.set('baseline', baseline)
+    rPr.get_or_change_to_solidFill().get_or_change_to_srgbClr().val = str(rgb)
+    if font_name:
+        rPr.get_or_add_latin().typeface = font_name
+    return r
+
+
 def _apply_highlights(paragraph, text, highlights, large_text=None,
                       body_rgb=None, highlight_rgb=None, annotation_rgb=None,
                       font_name=None, base_font_size=32, annotation_size_pt=46):
@@ -767,47 +1045,30 @@ def _apply_highlights(paragraph, text, highlights, large_text=None,
     body_rgb, highlight_rgb, annotation_rgb, font_name all come from _resolve_theme.
     base_font_size: point size for normal body and highlight runs (``large_text`` overrides per match).
     """
-    import re
-    _body = body_rgb or RGBColor(26, 26, 46)
-    _ann  = annotation_rgb or RGBColor(30, 80, 200)
+    _body = body_rgb or _DEFAULT_BODY_RGB
+    _ann  = annotation_rgb or _DEFAULT_ANNOTATION_RGB
     _base = int(base_font_size) if base_font_size else 32
+    p_elem = paragraph._p
 
-    def _sf(run, size_pt):
-        """Set font size and optional font name on a run."""
-        run.font.size = Pt(size_pt)
-        if font_name:
-            run.font.name = font_name
-
-    matches = []
-
+    specs = []
     if highlights:
         for fmt in _normalise_highlights(highlights, highlight_rgb=highlight_rgb):
-            pattern = re.escape(fmt['text'])
-            for match in re.finditer(pattern, text, re.IGNORECASE):
-                matches.append((match.start(), match.end(), match.group(), 'highlight', fmt))
-
+            specs.append((fmt['text'], 'highlight', fmt))
     if large_text:
         for word, font_size in large_text.items():
-            pattern = re.escape(word)
-            for match in re.finditer(pattern, text, re.IGNORECASE):
-                matches.append((match.start(), match.end(), match.group(), 'large', font_size))
-
-    matches.sort(key=lambda x: x[0])
-    filtered, last_end = [], -1
-    for m in matches:
-        if m[0] >= last_end:
-            filtered.append(m)
-            last_end = m[1]
+            specs.append((word, 'large', font_size))
+    specs = [spec for spec in specs if spec[0]]
 
-    _body = body_rgb or RGBColor(26, 26, 46)
+    # One left-to-right scan yields non-overlapping matches by construction.
+    filtered = []
+    if specs:
+        phrases = tuple(spec[0] for spec in specs)
+        for start, end, idx in _find_phrase_spans(text, phrases):
+            _, fmt_type, fmt = specs[idx]
+            filtered.append((start, end, text[start:end], fmt_type, fmt))
 
     if not filtered:
-        run = paragraph.add_run()
-        run.text = text
-        _sf(run, _base)
-        run.font.color.rgb = _body
-        if font_name:
-            run.font.name = font_name
+        _append_run(p_elem, text, _base, _body, font_name)
         return
 
     current_pos = 0
@@ -815,55 +1076,37 @@ def _apply_highlights(paragraph, text, highlights, large_text=None,
     for start, end, matched_text, fmt_type, fmt in filtered:
         # Plain text before this match
         if start > current_pos:
-            run = paragraph.add_run()
-            run.text = text[current_pos:start]
-            _sf(run, _base)
-            run.font.color.rgb = _body
-            run.font.bold = False
-            run.font.italic = False
-            run.font.underline = False
-
-        # Formatted run — always add_run() to preserve any pre-existing runs
-        run = paragraph.add_run()
-        run.text = matched_text
+            _append_run(p_elem, text[current_pos:start], _base, _body, font_name,
+                        bold=False, italic=False, underline=False)
 
+        # Formatted run, appended after any pre-existing runs
         if fmt_type == 'highlight':
-            _sf(run, _base)
-            run.font.color.rgb = fmt['color']
-            run.font.bold = fmt['bold']
-            run.font.italic = fmt['italic']
-            run.font.underline = fmt['underline']
+            _append_run(p_elem, matched_text, _base, fmt['color'], font_name,
+                        bold=fmt['bold'], italic=fmt['italic'], underline=fmt['underline'])
             if fmt.get('annotation'):
-                ann_run = paragraph.add_run()
-                ann_run.text = fmt['annotation']
-                _sf(ann_run, int(annotation_size_pt))
-                ann_run.font.bold = False
-                ann_run.font.color.rgb = _ann
-                rPr = ann_run._r.get_or_add_rPr()
-                rPr.set('baseline', '30000')
+                _append_run(p_elem, fmt['annotation'], int(annotation_size_pt), _ann,
+                            font_name, bold=False, baseline='30000')
         elif fmt_type == 'large':
-            _sf(run, fmt)
-            run.font.color.rgb = _body
+            _append_run(p_elem, matched_text, fmt, _body, font_name)
 
         current_pos = end
 
     # Remaining plain text
     if current_pos < len(text):
-        run = paragraph.add_run()
-        run.text = text[current_pos:]
-        _sf(run, _base)
-        run.font.color.rgb = _body
-        run.font.bold = False
-        run.font.italic = False
-        run.font.underline = False
+        _append_run(p_elem, text[current_pos:], _base, _body, font_name,
+                    bold=False, italic=False, underline=False)
+
+
+_ALIGNMENTS = {
+    'left':   PP_ALIGN.LEFT,
+    'right':  PP_ALIGN.RIGHT,
+    'center': PP_ALIGN.CENTER,
+}
+
 
 def _resolve_alignment(align_str):
     """Convert alignment string to PP_ALIGN constant."""
-    return {
-        'left':   PP_ALIGN.LEFT,
-        'right':  PP_ALIGN.RIGHT,
-        'center': PP_ALIGN.CENTER,
-    }.get((align_str or 'center').lower(), PP_ALIGN.CENTER)
+    return _ALIGNMENTS.get((align_str or 'center').lower(), PP_ALIGN.CENTER)
 
 
 def add_list_slide(prs, items, reference, list_type='bullet', font_size=32,
@@ -875,7 +1118,7 @@ def add_list_slide(prs, items, reference, list_type='bullet', font_size=32,
     """
     style = style or {}
     theme = _resolve_theme(style)
-    slide = prs.slides.add_slide(prs.slide_layouts[6])
+    slide = _add_blank_slide(prs)
     _apply_slide_background(slide, style, prs)
 
     from .layout_tokens import pip_top_inches
@@ -1014,13 +1257,13 @@ def add_image_slide(prs, image_path, style=None, caption=None, reference=None,
     if source_file:
         style['_source_file'] = source_file
 
-    slide = prs.slides.add_slide(prs.slide_layouts[6])
+    slide = _add_blank_slide(prs)
     _apply_slide_background(slide, style, prs)
 
     resolved = resolve_asset_path(image_path, source_file=source_file)
     path = resolved if resolved else image_path
     if not path or not os.path.exists(path):
-        print(f"Warning: Image not found: {image_path}")
+        logger.warning("Image not found: %s", image_path)
         return slide
 
     theme = _resolve_theme(style)
@@ -1131,7 +1374,7 @@ def add_hebrew_rename_slide(prs, rows, style=None, font_size=110, reference=None
     hebrew_pt = int(font_size or style.get("hebrew_font_size") or 110)
     fn = _hebrew_font_name(style)
 
-    slide = prs.slides.add_slide(prs.slide_layouts[6])
+    slide = _add_blank_slide(prs)
     _apply_slide_background(slide, style, prs)
 
     slide_w_in = prs.slide_width.inches
@@ -1209,6 +1452,15 @@ def add_hebrew_rename_slide(prs, rows, style=None, font_size=110, reference=None
     return slide
 
 
+_VERSE_NUM_RE = re.compile(r"^(\d{1,3})\s+(.*)", re.DOTALL)
+
+# Books that appear with a numeric prefix (1/2/3 Timothy, etc.)
+_NUMBERED_BOOKS = frozenset([
+    "timothy", "corinthians", "thessalonians", "peter", "john",
+    "chronicles", "samuel", "kings", "esdras", "maccabees",
+])
+
+
 def _parse_verse_lines(text):
     """
     Parse verse text into [(verse_num_or_None, line_text), ...] pairs.
@@ -1217,25 +1469,16 @@ def _parse_verse_lines(text):
     e.g. '1 Therefore, holy brethren...' → [('1', 'Therefore, holy brethren...')]
     Returns [(None, full_text)] if no verse numbers detected.
     """
-    import re
-    VERSE_NUM_RE = re.compile(r"^(\d{1,3})\s+(.*)", re.DOTALL)
-
-    # Books that appear with a numeric prefix (1/2/3 Timothy, etc.)
-    NUMBERED_BOOKS = frozenset([
-        "timothy", "corinthians", "thessalonians", "peter", "john",
-        "chronicles", "samuel", "kings", "esdras", "maccabees",
-    ])
-
     raw_lines = [l.strip() for l in text.split("\n") if l.strip()]
     result = []
     for line in raw_lines:
-        m = VERSE_NUM_RE.match(line)
+        m = _VERSE_NUM_RE.match(line)
         if m:
             num_str = m.group(1)
             remainder = m.group(2)
             # If 1/2/3 followed by a numbered Bible book name -> plain text
             first_word = remainder.split()[0].lower().rstrip(",:)") if remainder.split() else ""
-            if int(num_str) in (1, 2, 3) and first_word in NUMBERED_BOOKS:
+            if int(num_str) in (1, 2, 3) and first_word in _NUMBERED_BOOKS:
                 result.append((None, line))
             else:
                 result.append((num_str, remainder))
@@ -1250,17 +1493,9 @@ def _parse_verse_lines(text):
 
 def _add_superscript_num_run(paragraph, num_str, font_size, body_rgb, font_name):
     """Add a small superscript verse-number run to a paragraph."""
-    from pptx.oxml.ns import qn
-    run = paragraph.add_run()
-    run.text = num_str + '\u2009'  # narrow space after number
-    run.font.size = Pt(int(font_size * 0.52))
-    run.font.color.rgb = body_rgb
-    run.font.bold = False
-    if font_name:
-        run.font.name = font_name
-    # Set superscript baseline (30 000 = 30% above normal)
-    rPr = run._r.get_or_add_rPr()
-    rPr.set('baseline', '30000')
+    # Narrow space after the number; baseline 30 000 = 30% above normal.
+    _append_run(paragraph._p, num_str + '\u2009', int(font_size * 0.52), body_rgb,
+                font_name, bold=False, baseline='30000')
 
 
 def add_verse_slide(prs, verse_text, reference, part_num=None, highlights=None,
@@ -1290,7 +1525,7 @@ def add_verse_slide(prs, verse_text, reference, part_num=None, highlights=None,
     theme = _resolve_theme(style)
     ann_pt = int(typography_pt(style, 'annotation_size_pt', 46))
     left, content_w, content_w_in, margin_in = content_box(prs, style, 'verse')
-    verse_slide = prs.slides.add_slide(prs.slide_layouts[6])
+    verse_slide = _add_blank_slide(prs)
     _apply_slide_background(verse_slide, style, prs)
     align = _resolve_alignment(alignment)
     ref_position = _normalize_ref_position(reference_position or theme['ref_position'])
@@ -1409,6 +1644,20 @@ def add_verse_slide(prs, verse_text, reference, part_num=None, highlights=None,
     verse_lines = _parse_verse_lines(verse_text)
     has_verse_nums = any(num for num, _ in verse_lines)
 
+    # Pick the line writer once per slide; plain verses skip the highlight scan.
+    if (highlights and len(highlights) > 0) or (large_text and len(large_text) > 0):
+        def _write_line(para, line_text):
+            _apply_highlights(para, line_text, highlights, large_text,
+                              body_rgb=theme['body'],
+                              highlight_rgb=theme['highlight'],
+                              annotation_rgb=theme['annotation'],
+                              font_name=fn,
+                              base_font_size=int(font_size),
+                              annotation_size_pt=ann_pt)
+    else:
+        def _write_line(para, line_text):
+            _append_run(para._p, line_text, font_size, theme['body'], fn)
+
     first_para = True
     for v_num, v_text in verse_lines:
         if first_para:
@@ -1418,25 +1667,9 @@ def add_verse_slide(prs, verse_text, reference, part_num=None, highlights=None,
             p = tf.add_paragraph()
         p.alignment = align
 
-        if (highlights and len(highlights) > 0) or (large_text and len(large_text) > 0):
-            if has_verse_nums and v_num:
-                _add_superscript_num_run(p, v_num, font_size, theme['body'], fn)
-            _apply_highlights(p, v_text, highlights, large_text,
-                              body_rgb=theme['body'],
-                              highlight_rgb=theme['highlight'],
-                              annotation_rgb=theme['annotation'],
-                              font_name=fn,
-                              base_font_size=int(font_size),
-                              annotation_size_pt=ann_pt)
-        else:
-            if has_verse_nums and v_num:
-                _add_superscript_num_run(p, v_num, font_size, theme['body'], fn)
-            run = p.add_run()
-            run.text = v_text
-            run.font.size = Pt(font_size)
-            run.font.color.rgb = theme['body']
-            if fn:
-                run.font.name = fn
+        if has_verse_nums and v_num:
+            _add_superscript_num_run(p, v_num, font_size, theme['body'], fn)
+        _write_line(p, v_text)
 
     if leading and extra_ref and leading_verse_top_in is not None and leading_verse_h_in is not None:
         below_top = leading_verse_top_in + leading_verse_h_in + 0.06
@@ -1597,7 +1830,7 @@ def create_presentation(data, output_file=None, custom_title=None,
     
     # Save presentation
     try:
-        prs.save(output_file)
+        _save_presentation(prs, output_file)
         print(f"✓ Presentation created successfully: {output_file}")
         
         # Convert to PDF if requested
@@ -1637,3 +1870,34 @@ def create_presentation(data, output_file=None, custom_title=None,
     except Exception as e:
         print(f"Error saving presentation: {e}")
         return None
+
+
+def _create_presentation_job(job):
+    data, output_file = job
+    return create_presentation(data, output_file=output_file)
+
+
+def create_presentations(jobs, max_workers=None):
+    """
+    Build several independent decks in parallel worker processes.
+
+    Each deck owns its own ``Presentation`` and package, so decks (unlike the
+    slides of one deck, which share relationships and part names) can be
+    built without coordination and without contending for the GIL.
+
+    Args:
+        jobs (iterable): ``(data, output_file)`` pairs, as accepted by
+                         :func:`create_presentation`
+        max_workers (int): Worker processes (default: ``os.cpu_count()``);
+                           ``1`` builds in the calling process
+
+    Returns:
+        list: One :func:`create_presentation` result per job, in input order
+    """
+    jobs = list(jobs)
+    if max_workers == 1 or len(jobs) <= 1:
+        return [_create_presentation_job(job) for job in jobs]
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        return list(pool.map(_create_presentation_job, jobs))
@@ -1239,14 +1239,14 @@ def _render_forecast_split(slide, prs, verse: dict, style: dict, theme: dict, *,
 def render_deck_slide(
     prs, kind: str, verse: dict, deck_style: Optional[dict] = None, *, source_file: Optional[str] = None
 ):
-    from .core import _apply_slide_background, _resolve_theme
+    from .core import _add_blank_slide, _apply_slide_background, _resolve_theme
 
     if kind not in DECK_SLIDE_TYPES:
         raise ValueError(f"Unknown deck slide kind: {kind}")
     style = resolve_deck_style(deck_style or {}, verse, kind)
     if source_file:
         style["_source_file"] = source_file
-    slide = prs.slides.add_slide(prs.slide_layouts[6])
+    slide = _add_blank_slide(prs)
     _apply_slide_background(slide, style, prs)
     theme = _resolve_theme(style)
     if kind == "deck_title_split":
@@ -5,15 +5,141 @@ This module provides functionality to upload PowerPoint files to Google Drive
 using the Google Drive API v3. Dependencies are loaded lazily only when needed.
 """
 
+import copy
+import functools
+import importlib
+import json
+import logging
 import os
+import random
+import threading
 import time
 from datetime import datetime
 from pathlib import Path
 from typing import Optional, Dict, Any, List, Tuple
-from .lazy_loader import lazy_import, check_optional_dependency
+from .lazy_loader import LazyImportError, check_optional_dependency
+
+logger = logging.getLogger(__name__)
 
 GOOGLE_DOC_MIME = "application/vnd.google-apps.document"
 
+_MIME_TYPES = {
+    '.pptx': 'application/vnd.openxmlformats-officedocument.presentationml.presentation',
+    '.ppt': 'application/vnd.ms-powerpoint',
+    '.pdf': 'application/pdf',
+    '.json': 'application/json',
+    '.txt': 'text/plain',
+    '.md': 'text/markdown',
+    '.markdown': 'text/markdown',
+    '.html': 'text/html',
+    '.htm': 'text/html',
+}
+
+# Files up to this size go up in a single multipart request; larger files use
+# a resumable session, which costs an extra round-trip per chunk.
+RESUMABLE_THRESHOLD = 5 * 1024 * 1024
+
+# Resumable chunk size. Drive requires a multiple of 256 KiB; chunks much below
+# ~5 MiB spend most of their time on per-request overhead.
+RESUMABLE_CHUNKSIZE = 8 * 1024 * 1024
+
+# Socket timeout for Drive API connections (httplib2 default is none).
+HTTP_TIMEOUT_SEC = 60
+
+# Rate-limited (HTTP 429) and transient server-error responses are retried
+# with exponential backoff. A 5xx may arrive after Drive has already applied
+# the request, so non-idempotent creates are retried on 429 only.
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+CREATE_RETRY_STATUSES = frozenset({429})
+RETRY_MAX_ATTEMPTS = 6
+RETRY_MAX_DELAY_SEC = 47.0
+
+
+def _http_status(exc: Exception) -> Optional[int]:
+    """Return the HTTP status of a googleapiclient ``HttpError`` (None otherwise)."""
+    resp = getattr(exc, "resp", None)
+    status = getattr(resp, "status", None)
+    try:
+        return int(status) if status is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+def _retry_delay(exc: Exception, attempt: int) -> float:
+    """Seconds to wait before retry ``attempt``; honours ``Retry-After`` when sent."""
+    resp = getattr(exc, "resp", None)
+    retry_after = resp.get("retry-after") if hasattr(resp, "get") else None
+    if retry_after is not None:
+        try:
+            return min(RETRY_MAX_DELAY_SEC, max(0.0, float(retry_after)))
+        except (TypeError, ValueError):
+            pass
+    return min(RETRY_MAX_DELAY_SEC, 2 ** attempt + random.random())
+
+
+def _execute_with_retry(request, max_attempts: int = RETRY_MAX_ATTEMPTS, *,
+                        statuses: frozenset = RETRY_STATUSES, gone_ok: bool = False):
+    """
+    Execute a Drive API request, backing off and retrying on ``statuses``.
+
+    With ``gone_ok`` (for deletes), a 404 on a retry means an earlier attempt
+    went through, so it returns None instead of raising.
+    """
+    for attempt in range(max_attempts):
+        try:
+            return request.execute()
+        except Exception as exc:
+            status = _http_status(exc)
+            if gone_ok and attempt and status == 404:
+                return None
+            if status not in statuses or attempt == max_attempts - 1:
+                raise
+            time.sleep(_retry_delay(exc, attempt))
+
+
+@functools.lru_cache(maxsize=None)
+def _gdrive_module(module_name: str):
+    """Import a Google API module once, with the [gdrive] install hint on failure."""
+    try:
+        return importlib.import_module(module_name)
+    except ImportError:
+        raise LazyImportError(module_name, 'Google Drive upload', 'gdrive')
+
+
+def _build():
+    """``googleapiclient.discovery.build``, imported on first use."""
+    return _gdrive_module('googleapiclient.discovery').build
+
+
+def _media_file_upload():
+    """``googleapiclient.http.MediaFileUpload``, imported on first use."""
+    return _gdrive_module('googleapiclient.http').MediaFileUpload
+
+
+# Every Google module the uploader imports on demand.
+_GDRIVE_MODULES = (
+    'google.auth',
+    'google.auth.transport.requests',
+    'google.oauth2.credentials',
+    'google.oauth2.service_account',
+    'google_auth_oauthlib.flow',
+    'google_auth_httplib2',
+    'googleapiclient.discovery',
+    'googleapiclient.http',
+    'httplib2',
+)
+
+
+def preload_gdrive_modules() -> None:
+    """
+    Import all Google Drive dependencies now instead of at first upload.
+
+    Raises:
+        LazyImportError: If any of them is missing
+    """
+    for module_name in _GDRIVE_MODULES:
+        _gdrive_module(module_name)
+
 
 def is_gdrive_available() -> bool:
     """
@@ -35,39 +161,44 @@ class GDriveUploader:
     This class handles authentication and file upload to Google Drive.
     Dependencies are only loaded when the class is instantiated.
     """
+
+    resumable_threshold = RESUMABLE_THRESHOLD
+    resumable_chunksize = RESUMABLE_CHUNKSIZE
     
     def __init__(self, credentials_path: Optional[str] = None, 
-                 credentials_dict: Optional[Dict[str, Any]] = None):
+                 credentials_dict: Optional[Dict[str, Any]] = None,
+                 resumable_threshold: int = RESUMABLE_THRESHOLD,
+                 resumable_chunksize: int = RESUMABLE_CHUNKSIZE,
+                 credentials: Any = None):
         """
         Initialize the Google Drive uploader.
         
         Args:
             credentials_path: Path to service account JSON credentials file
             credentials_dict: Dictionary containing service account credentials
+            resumable_threshold: Files larger than this many bytes use a
+                resumable upload; smaller ones are sent in one request
+            resumable_chunksize: Bytes per resumable chunk; must be a multiple
+                of 256 KiB, and values below ~5 MiB slow large uploads down
+            credentials: Already-loaded Google credentials; when given,
+                credentials_path and credentials_dict are ignored
         
         Note:
             Either credentials_path or credentials_dict must be provided.
             If both are provided, credentials_path takes precedence.
         """
-        # Lazy import Google Drive dependencies
-        self.service_account = lazy_import(
-            'google.oauth2.service_account',
-            'Google Drive upload',
-            'gdrive'
-        )
-        self.build = lazy_import(
-            'googleapiclient.discovery',
-            'Google Drive upload',
-            'gdrive'
-        ).build
-        self.MediaFileUpload = lazy_import(
-            'googleapiclient.http',
-            'Google Drive upload',
-            'gdrive'
-        ).MediaFileUpload
-        
+        self.resumable_threshold = resumable_threshold
+        self.resumable_chunksize = resumable_chunksize
+
+        # (parent_id, name) -> folder id; shared with upload_files workers,
+        # which are shallow copies, so one lock serializes their creates.
+        self._folder_cache: Dict[Tuple[Optional[str], str], str] = {}
+        self._folder_lock = threading.Lock()
+
         # Initialize credentials
-        self.credentials = self._get_credentials(credentials_path, credentials_dict)
+        if credentials is None:
+            credentials = self._get_credentials(credentials_path, credentials_dict)
+        self.credentials = credentials
         self.service = None
     
     def _get_credentials(self, credentials_path: Optional[str], 
@@ -85,6 +216,8 @@ class GDriveUploader:
         Raises:
             ValueError: If neither credentials_path nor credentials_dict is provided
         """
+        # Fail early with the install hint when the [gdrive] extra is missing.
+        _gdrive_module('google.auth')
         scopes = ['https://www.googleapis.com/auth/drive']
         
         if credentials_path:
@@ -179,11 +312,41 @@ class GDriveUploader:
         return creds
     
     def _get_service(self):
-        """Get or create the Google Drive service."""
+        """
+        Get or create the Google Drive service.
+
+        The service owns one authorised keep-alive HTTP connection, reused by
+        every request made through this uploader. httplib2 connections are not
+        thread-safe, so services (and their connections) are never shared
+        between threads; see :meth:`upload_files`.
+        """
         if self.service is None:
-            self.service = self.build('drive', 'v3', credentials=self.credentials)
+            httplib2 = _gdrive_module('httplib2')
+            google_auth_httplib2 = _gdrive_module('google_auth_httplib2')
+            http = google_auth_httplib2.AuthorizedHttp(
+                self.credentials, http=httplib2.Http(timeout=HTTP_TIMEOUT_SEC),
+            )
+            # static_discovery: build from the Drive v3 discovery document that
+            # ships with google-api-python-client instead of fetching it.
+            self.service = _build()(
+                'drive', 'v3', http=http, cache_discovery=False, static_discovery=True,
+            )
         return self.service
     
+    def _media_upload(self, file_path: str, mime_type: str, size: Optional[int] = None):
+        """Build the media body, resumable only for files above the threshold.
+
+        Pass ``size`` when the caller has already stat-ed the file.
+        """
+        if size is None:
+            size = os.stat(file_path).st_size
+        if size <= self.resumable_threshold:
+            return _media_file_upload()(file_path, mimetype=mime_type, resumable=False)
+        return _media_file_upload()(
+            file_path, mimetype=mime_type, resumable=True,
+            chunksize=self.resumable_chunksize,
+        )
+
     def _escape_query_value(self, value: str) -> str:
         """Escape a value for use in a Drive API query string."""
         return value.replace("\\", "\\\\").replace("'", "\\'")
@@ -200,20 +363,45 @@ class GDriveUploader:
         items: List[Dict[str, str]] = []
         page_token = None
         while True:
-            response = service.files().list(
+            response = _execute_with_retry(service.files().list(
                 q=query,
                 spaces="drive",
-                fields="nextPageToken,files(id,name,createdTime,modifiedTime)",
+                fields="nextPageToken,files(id)",
                 pageSize=page_size,
                 pageToken=page_token,
                 orderBy=order_by,
-            ).execute()
+            ))
             items.extend(response.get("files", []))
             page_token = response.get("nextPageToken")
             if not page_token:
                 break
         return items
 
+    def _first_drive_item_id(self, query: str, *, order_by: str) -> Optional[str]:
+        """
+        Return the id of the first item matching a query, one row per page.
+
+        Drive may return an empty page before the end of the results, so
+        pages are followed until one has a match or there are no more.
+        """
+        service = self._get_service()
+        page_token = None
+        while True:
+            response = _execute_with_retry(service.files().list(
+                q=query,
+                spaces="drive",
+                fields="nextPageToken,files(id)",
+                pageSize=1,
+                pageToken=page_token,
+                orderBy=order_by,
+            ))
+            files = response.get("files", [])
+            if files:
+                return files[0]["id"]
+            page_token = response.get("nextPageToken")
+            if not page_token:
+                return None
+
     def find_file_by_name(self, file_name: str, folder_id: Optional[str] = None) -> Optional[str]:
         """
         Find a file by name in a specific folder.
@@ -226,18 +414,17 @@ class GDriveUploader:
         if folder_id:
             query += f" and '{folder_id}' in parents"
 
-        files = self._list_drive_items(query, order_by="modifiedTime desc")
-        if files:
-            return files[0]["id"]
-        return None
+        return self._first_drive_item_id(query, order_by="modifiedTime desc")
     
-    def update_file(self, file_id: str, file_path: str) -> Dict[str, str]:
+    def update_file(self, file_id: str, file_path: str,
+                    size: Optional[int] = None) -> Dict[str, str]:
         """
         Update an existing file in Google Drive.
         
         Args:
             file_id: ID of the file to update
             file_path: Path to the new file content
+            size: File size in bytes, if already known (avoids another stat)
         
         Returns:
             Dictionary with file information
@@ -245,19 +432,15 @@ class GDriveUploader:
         mime_type = self._get_mime_type(file_path)
         
         # Create media upload
-        media = self.MediaFileUpload(
-            file_path,
-            mimetype=mime_type,
-            resumable=True
-        )
+        media = self._media_upload(file_path, mime_type, size)
         
         # Update file
         service = self._get_service()
-        file = service.files().update(
+        file = _execute_with_retry(service.files().update(
             fileId=file_id,
             media_body=media,
             fields='id, name, webViewLink, webContentLink'
-        ).execute()
+        ))
         
         return file
     
@@ -269,42 +452,35 @@ class GDriveUploader:
         overwrite: bool = True,
     ) -> Dict[str, str]:
         """Import a Markdown/text file as a native Google Doc."""
-        if not os.path.exists(file_path):
-            raise FileNotFoundError(f"File not found: {file_path}")
+        try:
+            size = os.stat(file_path).st_size
+        except FileNotFoundError:
+            raise FileNotFoundError(f"File not found: {file_path}") from None
 
         if file_name is None:
-            file_name = Path(file_path).stem
+            file_name = os.path.splitext(os.path.basename(file_path))[0]
 
+        # Markdown and HTML map to text/markdown and text/html, which Drive converts.
         source_mime = self._get_mime_type(file_path)
-        if Path(file_path).suffix.lower() in (".md", ".markdown"):
-            source_mime = "text/markdown"
-        elif Path(file_path).suffix.lower() in (".html", ".htm"):
-            source_mime = "text/html"
-
-        media = self.MediaFileUpload(
-            file_path,
-            mimetype=source_mime,
-            resumable=True,
-        )
+
+        media = self._media_upload(file_path, source_mime, size)
         service = self._get_service()
 
         if overwrite:
             existing_file_id = self.find_file_by_name(file_name, folder_id)
             if existing_file_id:
-                print(f"  Google Doc exists, updating: {file_name}")
+                logger.info("Google Doc exists, updating: %s", file_name)
                 try:
-                    return service.files().update(
+                    return _execute_with_retry(service.files().update(
                         fileId=existing_file_id,
                         media_body=media,
                         fields="id, name, webViewLink, webContentLink, mimeType",
-                    ).execute()
+                    ))
                 except Exception:
-                    service.files().delete(fileId=existing_file_id).execute()
-                    media = self.MediaFileUpload(
-                        file_path,
-                        mimetype=source_mime,
-                        resumable=True,
+                    _execute_with_retry(
+                        service.files().delete(fileId=existing_file_id), gone_ok=True,
                     )
+                    media = self._media_upload(file_path, source_mime, size)
 
         file_metadata: Dict[str, Any] = {
             "name": file_name,
@@ -313,11 +489,11 @@ class GDriveUploader:
         if folder_id:
             file_metadata["parents"] = [folder_id]
 
-        return service.files().create(
+        return _execute_with_retry(service.files().create(
             body=file_metadata,
             media_body=media,
             fields="id, name, webViewLink, webContentLink, mimeType",
-        ).execute()
+        ), statuses=CREATE_RETRY_STATUSES)
 
     def upload_file(self, file_path: str, folder_id: Optional[str] = None,
                    file_name: Optional[str] = None, overwrite: bool = True) -> Dict[str, str]:
@@ -343,19 +519,22 @@ class GDriveUploader:
             FileNotFoundError: If the file doesn't exist
             Exception: If upload fails
         """
-        if not os.path.exists(file_path):
-            raise FileNotFoundError(f"File not found: {file_path}")
+        # One stat covers the existence check and the resumable decision.
+        try:
+            size = os.stat(file_path).st_size
+        except FileNotFoundError:
+            raise FileNotFoundError(f"File not found: {file_path}") from None
         
         # Get file name
         if file_name is None:
-            file_name = Path(file_path).name
+            file_name = os.path.basename(file_path)
         
         # Check if file exists and overwrite is enabled
         if overwrite:
             existing_file_id = self.find_file_by_name(file_name, folder_id)
             if existing_file_id:
-                print(f"  File exists, updating: {file_name}")
-                return self.update_file(existing_file_id, file_path)
+                logger.info("File exists, updating: %s", file_name)
+                return self.update_file(existing_file_id, file_path, size)
         
         # Determine MIME type
         mime_type = self._get_mime_type(file_path)
@@ -370,23 +549,56 @@ class GDriveUploader:
             file_metadata['parents'] = [folder_id]
         
         # Create media upload
-        media = self.MediaFileUpload(
-            file_path,
-            mimetype=mime_type,
-            resumable=True
-        )
+        media = self._media_upload(file_path, mime_type, size)
         
         # Upload file
         service = self._get_service()
-        file = service.files().create(
+        file = _execute_with_retry(service.files().create(
             body=file_metadata,
             media_body=media,
             fields='id, name, webViewLink, webContentLink'
-        ).execute()
+        ), statuses=CREATE_RETRY_STATUSES)
         
         return file
+
+    def upload_files(self, file_paths: List[str], folder_id: Optional[str] = None,
+                     overwrite: bool = True, max_workers: int = 4) -> List[Dict[str, str]]:
+        """
+        Upload several files to the same folder concurrently.
+
+        Uploads are network-bound, so they run on a bounded thread pool. The
+        Drive client's HTTP transport is not thread-safe, so each worker thread
+        uses its own copy of this uploader (same credentials, own service).
+
+        Args:
+            file_paths: Paths of the files to upload
+            folder_id: Google Drive folder ID (optional)
+            overwrite: If True, updates existing files instead of creating duplicates
+            max_workers: Maximum concurrent uploads (default: 4)
+
+        Returns:
+            List of file information dictionaries, in input order
+        """
+        file_paths = list(file_paths)
+        if max_workers <= 1 or len(file_paths) <= 1:
+            return [self.upload_file(path, folder_id, overwrite=overwrite) for path in file_paths]
+
+        from concurrent.futures import ThreadPoolExecutor
+
+        local = threading.local()
+
+        def _upload(path: str) -> Dict[str, str]:
+            worker = getattr(local, "uploader", None)
+            if worker is None:
+                worker = local.uploader = copy.copy(self)
+                worker.service = None
+            return worker.upload_file(path, folder_id, overwrite=overwrite)
+
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            return list(pool.map(_upload, file_paths))
     
-    def _get_mime_type(self, file_path: str) -> str:
+    @staticmethod
+    def _get_mime_type(file_path: str) -> str:
         """
         Get MIME type for a file.
         
@@ -396,24 +608,11 @@ class GDriveUploader:
         Returns:
             MIME type string
         """
-        extension = Path(file_path).suffix.lower()
-        mime_types = {
-            '.pptx': 'application/vnd.openxmlformats-officedocument.presentationml.presentation',
-            '.ppt': 'application/vnd.ms-powerpoint',
-            '.pdf': 'application/pdf',
-            '.json': 'application/json',
-            '.txt': 'text/plain',
-            '.md': 'text/markdown',
-            '.markdown': 'text/markdown',
-            '.html': 'text/html',
-            '.htm': 'text/html',
-        }
-        return mime_types.get(extension, 'application/octet-stream')
+        extension = os.path.splitext(file_path)[1].lower()
+        return _MIME_TYPES.get(extension, 'application/octet-stream')
     
-    def _get_folder_ids_by_name(
-        self, folder_name: str, parent_id: Optional[str] = None
-    ) -> List[str]:
-        """Return folder IDs with this name under parent, oldest first."""
+    def _folder_query(self, folder_name: str, parent_id: Optional[str] = None) -> str:
+        """Drive query for non-trashed folders with this name under parent."""
         safe_name = self._escape_query_value(folder_name)
         query = (
             f"name='{safe_name}' and mimeType='application/vnd.google-apps.folder' "
@@ -421,7 +620,13 @@ class GDriveUploader:
         )
         if parent_id:
             query += f" and '{parent_id}' in parents"
+        return query
 
+    def _get_folder_ids_by_name(
+        self, folder_name: str, parent_id: Optional[str] = None
+    ) -> List[str]:
+        """Return folder IDs with this name under parent, oldest first."""
+        query = self._folder_query(folder_name, parent_id)
         folders = self._list_drive_items(query, order_by="createdTime")
         return [item["id"] for item in folders]
 
@@ -432,43 +637,71 @@ class GDriveUploader:
         When duplicate folders exist under the same parent, returns the oldest
         (canonical) folder so uploads stay consistent.
         """
-        folder_ids = self._get_folder_ids_by_name(folder_name, parent_id)
-        return folder_ids[0] if folder_ids else None
+        query = self._folder_query(folder_name, parent_id)
+        return self._first_drive_item_id(query, order_by="createdTime")
 
     def get_or_create_folder(
-        self, folder_name: str, parent_id: Optional[str] = None
+        self, folder_name: str, parent_id: Optional[str] = None,
+        *, parent_is_new: bool = False,
     ) -> Tuple[str, bool]:
         """
         Resolve a folder by name, creating it only when missing.
 
-        Re-queries after create to absorb parallel-upload races. If duplicates
-        already exist, always uses the oldest folder.
+        Resolved ids are cached per uploader, so repeat calls make no request.
+        Re-queries after create to absorb races with other processes; threads
+        sharing this uploader are serialized instead. If duplicates already
+        exist, always uses the oldest folder. ``parent_is_new`` skips the
+        initial lookup when the parent was just created and so cannot contain
+        the folder yet.
+
+        Returns:
+            (folder_id, created), where ``created`` is True only if the
+            returned folder is the one this call created. It is False when a
+            concurrent create elsewhere won the race, since that folder may
+            already have children.
         """
         folder_name = folder_name.strip()
         if not folder_name:
             raise ValueError("folder_name must be non-empty")
 
-        existing = self._get_folder_ids_by_name(folder_name, parent_id)
+        key = (parent_id, folder_name)
+        folder_id = self._folder_cache.get(key)
+        if folder_id is not None:
+            return folder_id, False
+
+        with self._folder_lock:
+            # Another thread may have resolved it while we waited.
+            folder_id = self._folder_cache.get(key)
+            if folder_id is not None:
+                return folder_id, False
+            folder_id, created = self._resolve_folder(folder_name, parent_id, parent_is_new)
+            self._folder_cache[key] = folder_id
+            return folder_id, created
+
+    def _resolve_folder(
+        self, folder_name: str, parent_id: Optional[str], parent_is_new: bool
+    ) -> Tuple[str, bool]:
+        """Look up a folder on Drive, creating it if missing (uncached)."""
+        existing = [] if parent_is_new else self._get_folder_ids_by_name(folder_name, parent_id)
         if existing:
             if len(existing) > 1:
-                print(
-                    f"  Note: {len(existing)} folders named '{folder_name}' found; "
-                    "using oldest"
+                logger.warning(
+                    "%d folders named '%s' found; using oldest", len(existing), folder_name
                 )
             return existing[0], False
 
-        self.create_folder(folder_name, parent_id)
+        new_id = self.create_folder(folder_name, parent_id)
 
         for delay in (0.15, 0.35, 0.75):
             time.sleep(delay)
             existing = self._get_folder_ids_by_name(folder_name, parent_id)
             if existing:
                 if len(existing) > 1:
-                    print(
-                        f"  Note: {len(existing)} folders named '{folder_name}' found; "
-                        "using oldest"
+                    logger.warning(
+                        "%d folders named '%s' found; using oldest",
+                        len(existing), folder_name,
                     )
-                return existing[0], True
+                return existing[0], existing[0] == new_id
 
         raise RuntimeError(f"Failed to resolve folder '{folder_name}' after create")
 
@@ -484,13 +717,17 @@ class GDriveUploader:
         folders = folder_path.split("/")
         current_parent = parent_id
         created_any = False
+        created = False
 
         for folder_name in folders:
             folder_name = folder_name.strip()
             if not folder_name:
                 continue
 
-            current_parent, created = self.get_or_create_folder(folder_name, current_parent)
+            # Below a folder this call created there is nothing to look up.
+            current_parent, created = self.get_or_create_folder(
+                folder_name, current_parent, parent_is_new=created,
+            )
             created_any = created_any or created
 
         if current_parent is None:
@@ -523,10 +760,10 @@ class GDriveUploader:
         if parent_id:
             file_metadata['parents'] = [parent_id]
         
-        folder = service.files().create(
+        folder = _execute_with_retry(service.files().create(
             body=file_metadata,
             fields='id'
-        ).execute()
+        ), statuses=CREATE_RETRY_STATUSES)
         
         return folder['id']
 
@@ -536,6 +773,58 @@ def google_doc_edit_link(file_id: str) -> str:
     return f"https://docs.google.com/document/d/{file_id}/edit"
 
 
+# credentials source -> loaded credentials, so repeated uploads in one process
+# do not reload (or re-run the OAuth flow for) the same credentials. Drive
+# services wrap a non-thread-safe httplib2 connection, so they are only reused
+# within a thread: _THREAD_SERVICES.by_key maps credentials source -> service.
+_CREDENTIALS: Dict[Tuple, Any] = {}
+_CREDENTIALS_LOCK = threading.Lock()
+_THREAD_SERVICES = threading.local()
+
+
+def _uploader_cache_key(credentials_path: Optional[str],
+                        credentials_dict: Optional[Dict[str, Any]]) -> Tuple:
+    """Key cached credentials by where they come from."""
+    if credentials_path:
+        path = os.path.abspath(credentials_path)
+        try:
+            mtime_ns = os.stat(path).st_mtime_ns
+        except OSError:
+            mtime_ns = None
+        return ("path", path, mtime_ns)
+    if credentials_dict:
+        return ("dict", json.dumps(credentials_dict, sort_keys=True, default=str))
+    return ("adc",)
+
+
+def _get_uploader(credentials_path: Optional[str] = None,
+                  credentials_dict: Optional[Dict[str, Any]] = None) -> "GDriveUploader":
+    """
+    Return a fresh GDriveUploader for one upload call.
+
+    Credentials are loaded once per source for the whole process, and the
+    Drive service is reused by later calls on the same thread. Folder lookups
+    are cached only for the lifetime of the returned uploader.
+    """
+    key = _uploader_cache_key(credentials_path, credentials_dict)
+    with _CREDENTIALS_LOCK:
+        credentials = _CREDENTIALS.get(key)
+        if credentials is None:
+            uploader = GDriveUploader(credentials_path, credentials_dict)
+            _CREDENTIALS[key] = uploader.credentials
+        else:
+            uploader = GDriveUploader(credentials=credentials)
+
+    services = getattr(_THREAD_SERVICES, "by_key", None)
+    if services is None:
+        services = _THREAD_SERVICES.by_key = {}
+    service = services.get(key)
+    if service is None:
+        service = services[key] = uploader._get_service()
+    uploader.service = service
+    return uploader
+
+
 def upload_to_gdrive(file_path: str, 
                     credentials_path: Optional[str] = None,
                     credentials_dict: Optional[Dict[str, Any]] = None,
@@ -572,16 +861,16 @@ def upload_to_gdrive(file_path: str,
         ... )
         >>> print(f"Uploaded: {result['webViewLink']}")
     """
-    uploader = GDriveUploader(credentials_path, credentials_dict)
+    uploader = _get_uploader(credentials_path, credentials_dict)
     
     # Handle folder_name if provided
     target_folder_id = folder_id
     if folder_name and not folder_id:
         target_folder_id, created = uploader.get_or_create_folder(folder_name)
         if created:
-            print(f"Created folder: {folder_name}")
+            logger.info("Created folder: %s", folder_name)
         else:
-            print(f"Using folder: {folder_name}")
+            logger.info("Using folder: %s", folder_name)
 
     # Handle date-based folders if enabled
     if use_date_folders:
@@ -592,9 +881,9 @@ def upload_to_gdrive(file_path: str,
 
         target_folder_id, created = uploader.ensure_folder_path(date_path, target_folder_id)
         if created:
-            print(f"Created date folder: {date_path}")
+            logger.info("Created date folder: %s", date_path)
         else:
-            print(f"Using date folder: {date_path}")
+            logger.info("Using date folder: %s", date_path)
     
     # Upload file
     if as_google_doc:
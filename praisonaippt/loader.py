@@ -2,7 +2,12 @@
 Data loading and validation functions for Bible verses.
 """
 
+import functools
 import json
+import mmap
+import os
+import pickle
+import threading
 import yaml
 from pathlib import Path
 
@@ -10,6 +15,36 @@ from .exceptions import SchemaError
 from .schema import validate_verses
 from .template_resolver import apply_template_layers
 
+try:  # Optional C parser; ``orjson.JSONDecodeError`` subclasses ``json.JSONDecodeError``.
+    import orjson as _orjson
+except ImportError:  # pragma: no cover - depends on the [fast-json] extra
+    _orjson = None
+
+
+# JSON files at least this large are memory-mapped for orjson instead of read.
+JSON_MMAP_MIN_BYTES = 1 << 20
+
+# (path, mtime_ns, size) -> pickled parse of a YAML deck. YAML parsing costs
+# 0.4-10 ms per deck, and unpickling a cached copy about 16 us. JSON is not
+# cached: re-parsing it is as cheap as any copy of a cached result.
+_YAML_CACHE: dict = {}
+_YAML_CACHE_MAX = 32
+_YAML_CACHE_LOCK = threading.Lock()
+
+
+def _json_loads(raw: bytes):
+    """Parse JSON bytes with orjson when installed, else the stdlib parser."""
+    if _orjson is not None:
+        return _orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _load_json_mmap(file_path: Path):
+    """Parse a JSON file with orjson straight from a read-only memory map."""
+    with open(file_path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        with memoryview(mm) as view:
+            return _orjson.loads(view)
+
 
 def deck_file_format(filepath: str | Path) -> str:
     """Return ``json`` or ``yaml`` from the file suffix (default yaml)."""
@@ -17,24 +52,59 @@ def deck_file_format(filepath: str | Path) -> str:
     return "json" if ext == ".json" else "yaml"
 
 
+def _parse_deck_file(file_path: Path, size: int):
+    """Parse a deck file as JSON or YAML (uncached)."""
+    suffix = file_path.suffix.lower()
+    if suffix in (".yaml", ".yml"):
+        with open(file_path, encoding="utf-8") as f:
+            return yaml.safe_load(f)
+    if suffix == ".json" and _orjson is not None and size >= JSON_MMAP_MIN_BYTES:
+        return _load_json_mmap(file_path)
+    raw = file_path.read_bytes()
+    if suffix == ".json":
+        return _json_loads(raw)
+    try:
+        return _json_loads(raw)
+    except json.JSONDecodeError:
+        return yaml.safe_load(raw.decode("utf-8"))
+
+
+def _load_deck_data(file_path: Path):
+    """
+    Parse a deck file, reusing an earlier YAML parse of the unchanged file.
+
+    The stat fields are part of the cache key so an edited file is re-parsed.
+    Every call returns objects the caller owns: a fresh parse on a miss, an
+    unpickled copy on a hit.
+    """
+    st = os.stat(file_path)
+    if file_path.suffix.lower() == ".json":
+        return _parse_deck_file(file_path, st.st_size)
+
+    key = (str(file_path.resolve()), st.st_mtime_ns, st.st_size)
+    with _YAML_CACHE_LOCK:
+        cached = _YAML_CACHE.get(key)
+    if cached is not None:
+        return pickle.loads(cached)
+
+    data = _parse_deck_file(file_path, st.st_size)
+    with _YAML_CACHE_LOCK:
+        if len(_YAML_CACHE) >= _YAML_CACHE_MAX:
+            _YAML_CACHE.pop(next(iter(_YAML_CACHE)))
+        _YAML_CACHE[key] = pickle.dumps(data, pickle.HIGHEST_PROTOCOL)
+    return data
+
+
 def load_deck_mapping(filepath: str | Path) -> dict:
     """
     Parse a deck file to a dict (no template merge or schema validation).
 
+    YAML parses are cached by path, mtime and size. The result is always the
+    caller's own copy, so it may be mutated.
+
     Use :func:`load_verses_from_file` for full load + validate.
     """
-    file_path = Path(filepath)
-    with open(file_path, encoding="utf-8") as f:
-        if file_path.suffix.lower() == ".json":
-            data = json.load(f)
-        elif file_path.suffix.lower() in (".yaml", ".yml"):
-            data = yaml.safe_load(f)
-        else:
-            text = f.read()
-            try:
-                data = json.loads(text)
-            except json.JSONDecodeError:
-                data = yaml.safe_load(text)
+    data = _load_deck_data(Path(filepath))
     if not isinstance(data, dict):
         raise ValueError(f"Top level of '{filepath}' must be a mapping")
     return data
@@ -151,6 +221,27 @@ def get_example_path(example_name):
     return None
 
 
+_EXAMPLE_EXTENSIONS = ('.yaml', '.yml', '.json')
+
+
+@functools.lru_cache(maxsize=4)
+def _scan_examples(examples_dir: str, mtime_ns: int) -> tuple:
+    """Return sorted example filenames; ``mtime_ns`` keys the cache to the directory."""
+    stems = {}
+    with os.scandir(examples_dir) as entries:
+        for entry in entries:
+            stem, ext = os.path.splitext(entry.name)
+            if ext in _EXAMPLE_EXTENSIONS and entry.is_file():
+                stems.setdefault(stem, set()).add(ext)
+
+    result = []
+    for stem, exts in stems.items():
+        # Prefer .yaml, then .yml, then .json for the same stem.
+        ext = next(e for e in _EXAMPLE_EXTENSIONS if e in exts)
+        result.append(f"{stem}{ext}")
+    return tuple(sorted(result))
+
+
 def list_examples():
     """
     List all available example files.
@@ -160,26 +251,11 @@ def list_examples():
     Returns:
         list: List of example filenames (preferring .yaml over .json)
     """
-    package_dir = Path(__file__).parent.parent
-    examples_dir = package_dir / 'examples'
+    examples_dir = Path(__file__).parent.parent / 'examples'
 
-    if not examples_dir.exists():
+    try:
+        st = os.stat(examples_dir)
+    except OSError:
         return []
 
-    stems = {}
-    for ext in ['.yaml', '.yml', '.json']:
-        for f in examples_dir.glob(f'*{ext}'):
-            if f.stem not in stems:
-                stems[f.stem] = []
-            stems[f.stem].append(ext)
-
-    result = []
-    for stem, exts in stems.items():
-        if '.yaml' in exts:
-            result.append(f"{stem}.yaml")
-        elif '.yml' in exts:
-            result.append(f"{stem}.yml")
-        else:
-            result.append(f"{stem}.json")
-
-    return sorted(result)
+    return list(_scan_examples(str(examples_dir), st.st_mtime_ns))
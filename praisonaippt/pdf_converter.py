@@ -343,10 +343,10 @@ def convert_pptx_to_pdf_via_gdrive(pptx_path: str, pdf_path: str) -> str:
     """
     # Imports kept local so this module stays importable without the gdrive extra.
     import io
-    from .gdrive_uploader import GDriveUploader
+    from .gdrive_uploader import _get_uploader
     from googleapiclient.http import MediaIoBaseDownload, MediaFileUpload
 
-    uploader = GDriveUploader()
+    uploader = _get_uploader()
     service = uploader._get_service()
 
     metadata = {
@@ -142,7 +142,8 @@ def validate_verses(data: Any) -> Dict[str, Any]:
 
     _warn_unknown(data.keys(), _TOP_LEVEL_KEYS, "top-level")
 
-    from .yaml_validate import validate_deck_options
+    from .slide_renderers import validate_verse
+    from .yaml_validate import validate_deck_options, validate_verse_options
 
     validate_deck_options(data)
 
@@ -173,9 +174,6 @@ def validate_verses(data: Any) -> Dict[str, Any]:
                 f"sections[{s_idx}].verses[{v_idx}]",
             )
             path = f"sections[{s_idx}].verses[{v_idx}]"
-            from .slide_renderers import validate_verse
-            from .yaml_validate import validate_verse_options
-
             validate_verse(verse, path)
             validate_verse_options(verse, path)
 
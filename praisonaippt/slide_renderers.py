@@ -90,6 +90,22 @@ def _column_texts(verse: dict) -> tuple:
     return verse.get("left", ""), verse.get("right", ""), None, None
 
 
+def verse_text_parts(verse: dict, deck_style: dict) -> List[str]:
+    """
+    Split a verse's text into per-slide parts using its split_max_length.
+
+    ``deck_style`` is the deck-level style; the verse's own ``slide_style`` is
+    merged in here so the renderer and the video slide plan agree.
+    """
+    from .deck_slides import resolve_deck_style
+    from .layout_tokens import split_max_length_default
+    from .utils import split_long_text
+
+    style = resolve_deck_style(deck_style, verse, VerseRenderer.kind)
+    max_len = int(verse.get("split_max_length") or split_max_length_default(style))
+    return split_long_text(verse.get("text", ""), max_length=max(max_len, 50))
+
+
 def _table_rows(verse: dict) -> List[List[str]]:
     raw = verse.get("table_rows") or verse.get("rows")
     if not raw:
@@ -351,17 +367,15 @@ class VerseRenderer:
 
     def render(self, prs, verse: dict, style: dict, *, source_file: Optional[str] = None) -> None:
         from .deck_slides import resolve_deck_style
-        from .layout_tokens import body_font_size, split_max_length_default
+        from .layout_tokens import body_font_size
         from .core import add_verse_slide
-        from .utils import split_long_text
 
+        parts = verse_text_parts(verse, style)
         style = resolve_deck_style(style, verse, self.kind)
         highlights = verse.get("highlights")
         large_text = verse.get("large_text")
         alignment = verse.get("alignment", style.get("alignment", "left"))
         font_size = body_font_size(style, verse)
-        max_len = int(verse.get("split_max_length") or split_max_length_default(style))
-        parts = split_long_text(verse.get("text", ""), max_length=max(max_len, 50))
         notes = verse.get("notes")
 
         for i, part in enumerate(parts):
@@ -7,6 +7,13 @@ import re
 from pathlib import Path
 from typing import Optional, Union
 
+# Sentence boundary: the space after '.', '!' or '?' (the space is dropped).
+_SENTENCE_BREAK_RE = re.compile(r'(?<=[.!?]) ')
+
+# One translate pass drops characters invalid in filenames and maps spaces to '_'.
+_FILENAME_TABLE = str.maketrans({' ': '_', **{c: None for c in '<>:"/\\|?*'}})
+_UNDERSCORE_RUN_RE = re.compile(r'_{2,}')
+
 
 def resolve_asset_path(
     path: Union[str, Path],
@@ -58,20 +65,21 @@ def split_long_text(text, max_length=200):
         return [text]
     
     # Split at sentences first
-    sentences = text.replace('. ', '.|').replace('! ', '!|').replace('? ', '?|').split('|')
+    sentences = _SENTENCE_BREAK_RE.split(text)
     parts = []
-    current_part = ""
+    current, current_len = [], 0
     
     for sentence in sentences:
-        if len(current_part + sentence) <= max_length:
-            current_part += sentence
+        if current_len + len(sentence) <= max_length:
+            current.append(sentence)
+            current_len += len(sentence)
         else:
-            if current_part:
-                parts.append(current_part.strip())
-            current_part = sentence
+            if current_len:
+                parts.append(''.join(current).strip())
+            current, current_len = [sentence], len(sentence)
     
-    if current_part:
-        parts.append(current_part.strip())
+    if current_len:
+        parts.append(''.join(current).strip())
     
     return parts if parts else [text]
 
@@ -86,12 +94,9 @@ def sanitize_filename(filename):
     Returns:
         str: Sanitized filename
     """
-    # Remove invalid characters
-    filename = re.sub(r'[<>:"/\\|?*]', '', filename)
-    # Replace spaces with underscores
-    filename = filename.replace(' ', '_')
+    # Remove invalid characters and replace spaces with underscores
+    filename = filename.translate(_FILENAME_TABLE)
     # Remove multiple underscores
-    filename = re.sub(r'_+', '_', filename)
+    filename = _UNDERSCORE_RUN_RE.sub('_', filename)
     # Remove leading/trailing underscores
-    filename = filename.strip('_')
-    return filename
+    return filename.strip('_')
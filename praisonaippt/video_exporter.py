@@ -286,20 +286,11 @@ def iter_slide_plan(data: dict, custom_title: Optional[str] = None):
         for verse in section.get("verses", []):
             if not isinstance(verse, dict):
                 continue
-            from .slide_renderers import resolve_renderer
+            from .slide_renderers import resolve_renderer, verse_text_parts
 
             renderer = resolve_renderer(verse)
             if renderer.kind == "verse":
-                from .layout_tokens import split_max_length_default
-                from .utils import split_long_text
-
-                style = data.get("slide_style") or {}
-                max_len = int(
-                    verse.get("split_max_length") or split_max_length_default(style)
-                )
-                parts = split_long_text(
-                    verse.get("text", ""), max_length=max(max_len, 50)
-                )
+                parts = verse_text_parts(verse, data.get("slide_style") or {})
                 for part_idx in range(len(parts)):
                     yield {
                         "slide_role": "content",
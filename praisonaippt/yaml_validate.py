@@ -452,16 +452,26 @@ def _validate_text_panel(tp: Any, path: str) -> None:
         raise SchemaError(f"{path}.hero_layout must be stacked or full_bleed")
 
 
+# Enum-valued verse keys checked up front; paths are only formatted for keys
+# that are present, since most verses set few of them.
+_VERSE_ENUM_KEYS = (
+    ("alignment", _ALIGNMENT),
+    ("reference_position", _REFERENCE_POSITION),
+    ("list_type", _LIST_TYPE),
+    ("image_fit", _IMAGE_FIT),
+    ("media_fit", _IMAGE_FIT),
+    ("image_side", _IMAGE_SIDE),
+    ("narration_mode", _NARRATION_MODE),
+    ("sync_mode", _SYNC_MODE),
+)
+
+
 def validate_verse_options(verse: dict, path: str) -> None:
     """Enum and shape checks shared by all verse types (after renderer-specific rules)."""
-    _check_enum(verse.get("alignment"), _ALIGNMENT, f"{path}.alignment")
-    _check_enum(verse.get("reference_position"), _REFERENCE_POSITION, f"{path}.reference_position")
-    _check_enum(verse.get("list_type"), _LIST_TYPE, f"{path}.list_type")
-    _check_enum(verse.get("image_fit"), _IMAGE_FIT, f"{path}.image_fit")
-    _check_enum(verse.get("media_fit"), _IMAGE_FIT, f"{path}.media_fit")
-    _check_enum(verse.get("image_side"), _IMAGE_SIDE, f"{path}.image_side")
-    _check_enum(verse.get("narration_mode"), _NARRATION_MODE, f"{path}.narration_mode")
-    _check_enum(verse.get("sync_mode"), _SYNC_MODE, f"{path}.sync_mode")
+    for key, allowed in _VERSE_ENUM_KEYS:
+        value = verse.get(key)
+        if value is not None:
+            _check_enum(value, allowed, f"{path}.{key}")
 
     if verse.get("header_row") is not None:
         _check_bool(verse["header_row"], f"{path}.header_row")
@@ -483,11 +493,14 @@ def validate_verse_options(verse: dict, path: str) -> None:
         if n < 50:
             raise SchemaError(f"{path}.split_max_length must be at least 50")
 
-    _check_positive_number(verse.get("duration_sec"), f"{path}.duration_sec", allow_zero=True)
-    _check_positive_number(verse.get("audio_start_sec"), f"{path}.audio_start_sec", allow_zero=True)
+    for key in ("duration_sec", "audio_start_sec"):
+        if verse.get(key) is not None:
+            _check_positive_number(verse[key], f"{path}.{key}", allow_zero=True)
 
-    _validate_qa_block(verse.get("qa"), f"{path}.qa")
-    _validate_text_panel(verse.get("text_panel"), f"{path}.text_panel")
+    if verse.get("qa") is not None:
+        _validate_qa_block(verse["qa"], f"{path}.qa")
+    if verse.get("text_panel") is not None:
+        _validate_text_panel(verse["text_panel"], f"{path}.text_panel")
 
     if verse.get("avatar_shape") is not None:
         _check_enum(verse["avatar_shape"], _AVATAR_SHAPES, f"{path}.avatar_shape")
@@ -515,7 +528,8 @@ def validate_verse_options(verse: dict, path: str) -> None:
             val = float(verse[flat_key])
             if val < 0.5 or val > 3.0:
                 raise SchemaError(f"{path}.{flat_key} must be between 0.5 and 3.0, got {val}")
-    _check_enum(verse.get("avatar_fit"), _AVATAR_FIT, f"{path}.avatar_fit")
+    if verse.get("avatar_fit") is not None:
+        _check_enum(verse["avatar_fit"], _AVATAR_FIT, f"{path}.avatar_fit")
     if verse.get("video_overlay") is not None:
         validate_video_overlay_block(verse["video_overlay"], f"{path}.video_overlay")
 
@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""
+Time repeated ``load_deck_mapping`` calls against a plain parse of the same file.
+
+Usage (from repo root):
+  python scripts/bench_deck_load.py
+  python scripts/bench_deck_load.py examples/tamil_verses.yaml -n 500
+
+Requires: praisonaippt importable (e.g. `pip install -e .`); orjson is used when installed.
+"""
+
+from __future__ import annotations
+
+import argparse
+import timeit
+from pathlib import Path
+
+from praisonaippt.loader import _parse_deck_file, load_deck_mapping
+
+DEFAULT_DECKS = (
+    "examples/full_restoration.json",
+    "examples/tamil_verses.yaml",
+    "examples/receive_a_hundredfold_now.yaml",
+)
+
+
+def best_us(fn, runs: int) -> float:
+    """Best-of-five per-call time of ``fn`` in microseconds."""
+    return min(timeit.repeat(fn, number=runs, repeat=5)) / runs * 1e6
+
+
+def main() -> int:
+    p = argparse.ArgumentParser(description="Benchmark deck loading.")
+    p.add_argument("decks", nargs="*", default=DEFAULT_DECKS, help="Deck files to load")
+    p.add_argument("-n", "--runs", type=int, default=200, help="Calls per timing (default: 200)")
+    args = p.parse_args()
+
+    for deck in args.decks:
+        path = Path(deck).resolve()
+        size = path.stat().st_size
+        load_deck_mapping(path)  # warm the cache
+        parse = best_us(lambda: _parse_deck_file(path, size), args.runs)
+        load = best_us(lambda: load_deck_mapping(path), args.runs)
+        print(f"{deck}: parse {parse:8.1f} us   load_deck_mapping {load:8.1f} us")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+"""
+Time ``import praisonaippt`` in fresh interpreters to catch import-time regressions.
+
+Usage (from repo root):
+  python scripts/bench_import.py
+  python scripts/bench_import.py -n 50 --module praisonaippt.cli
+  PRAISONAIPPT_EAGER_IMPORT=1 python scripts/bench_import.py
+
+Requires: stdlib only.
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+
+
+def time_import(module: str) -> float:
+    """Return wall-clock seconds for one ``python -c "import <module>"`` run."""
+    start = time.perf_counter()
+    subprocess.run([sys.executable, "-c", f"import {module}"], check=True)
+    return time.perf_counter() - start
+
+
+def main() -> int:
+    p = argparse.ArgumentParser(description="Benchmark package import time.")
+    p.add_argument("-n", "--runs", type=int, default=20, help="Subprocess runs (default: 20)")
+    p.add_argument("--module", default="praisonaippt", help="Module to import (default: praisonaippt)")
+    args = p.parse_args()
+
+    baseline = [time_import("sys") for _ in range(max(3, args.runs // 4))]
+    samples = [time_import(args.module) for _ in range(args.runs)]
+    floor = min(baseline)
+
+    print(f"import {args.module}: {args.runs} runs")
+    print(f"  min    {(min(samples) - floor) * 1000:7.1f} ms")
+    print(f"  median {(statistics.median(samples) - floor) * 1000:7.1f} ms")
+    print(f"  (interpreter start-up of {floor * 1000:.1f} ms subtracted)")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
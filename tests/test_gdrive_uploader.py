@@ -1,12 +1,18 @@
 """Tests for Google Drive folder resolution and duplicate handling."""
 
+import os
+import threading
 from unittest.mock import MagicMock, patch
 
+import pytest
+
 from praisonaippt.gdrive_uploader import GDriveUploader
 
 
 def _uploader_with_mock_service(list_side_effect):
     uploader = GDriveUploader.__new__(GDriveUploader)
+    uploader._folder_cache = {}
+    uploader._folder_lock = threading.Lock()
     service = MagicMock()
     service.files.return_value.list.return_value.execute.side_effect = list_side_effect
     uploader.service = service
@@ -29,6 +35,20 @@ def test_get_folder_id_by_name_uses_oldest_folder():
     assert folder_id == "older"
     call_kwargs = service.files.return_value.list.call_args.kwargs
     assert call_kwargs["orderBy"] == "createdTime"
+    assert call_kwargs["pageSize"] == 1
+    assert call_kwargs["fields"] == "nextPageToken,files(id)"
+
+
+def test_get_folder_id_by_name_follows_empty_pages():
+    responses = [
+        {"files": [], "nextPageToken": "p2"},
+        {"files": [{"id": "folder"}], "nextPageToken": "p3"},
+    ]
+    uploader, service = _uploader_with_mock_service(responses)
+
+    assert uploader.get_folder_id_by_name("06") == "folder"
+    list_calls = service.files.return_value.list.call_args_list
+    assert [c.kwargs["pageToken"] for c in list_calls] == [None, "p2"]
 
 
 def test_get_or_create_folder_reuses_existing_without_create():
@@ -43,7 +63,7 @@ def test_get_or_create_folder_reuses_existing_without_create():
 
 
 @patch("praisonaippt.gdrive_uploader.time.sleep")
-def test_get_or_create_folder_picks_oldest_after_parallel_create(mock_sleep):
+def test_get_or_create_folder_picks_oldest_after_parallel_create(mock_sleep, caplog):
     responses = [
         {"files": []},
         {
@@ -56,12 +76,14 @@ def test_get_or_create_folder_picks_oldest_after_parallel_create(mock_sleep):
     uploader, service = _uploader_with_mock_service(responses)
     service.files.return_value.create.return_value.execute.return_value = {"id": "second"}
 
-    folder_id, created = uploader.get_or_create_folder("06", parent_id="year-folder")
+    with caplog.at_level("WARNING", logger="praisonaippt.gdrive_uploader"):
+        folder_id, created = uploader.get_or_create_folder("06", parent_id="year-folder")
 
     assert folder_id == "first"
-    assert created is True
+    assert created is False
     service.files.return_value.create.assert_called_once()
     mock_sleep.assert_called()
+    assert "2 folders named '06' found; using oldest" in caplog.text
 
 
 def test_find_file_by_name_uses_most_recently_modified():
@@ -85,3 +107,280 @@ def test_find_file_by_name_uses_most_recently_modified():
 def test_escape_query_value():
     uploader = GDriveUploader.__new__(GDriveUploader)
     assert uploader._escape_query_value("Abraham's deck") == "Abraham\\'s deck"
+
+
+def test_get_uploader_shares_credentials_but_not_services_across_threads(monkeypatch, tmp_path):
+    from praisonaippt import gdrive_uploader
+
+    monkeypatch.setattr(gdrive_uploader, "_CREDENTIALS", {})
+    monkeypatch.setattr(gdrive_uploader, "_THREAD_SERVICES", threading.local())
+    loaded = []
+
+    def fake_credentials(self, credentials_path, credentials_dict):
+        loaded.append((credentials_path, credentials_dict))
+        return object()
+
+    def fake_service(self):
+        self.service = object()
+        return self.service
+
+    monkeypatch.setattr(GDriveUploader, "_get_credentials", fake_credentials)
+    monkeypatch.setattr(GDriveUploader, "_get_service", fake_service)
+    creds = tmp_path / "creds.json"
+    creds.write_text("{}", encoding="utf-8")
+
+    first = gdrive_uploader._get_uploader(str(creds))
+    second = gdrive_uploader._get_uploader(str(creds))
+    assert second is not first
+    assert second.credentials is first.credentials
+    assert second.service is first.service
+    assert second._folder_cache is not first._folder_cache
+
+    other_thread = []
+    worker = threading.Thread(
+        target=lambda: other_thread.append(gdrive_uploader._get_uploader(str(creds)))
+    )
+    worker.start()
+    worker.join()
+    assert other_thread[0].credentials is first.credentials
+    assert other_thread[0].service is not first.service
+
+    gdrive_uploader._get_uploader(credentials_dict={"type": "x"})
+    gdrive_uploader._get_uploader()
+    gdrive_uploader._get_uploader()
+    assert len(loaded) == 3
+
+
+@patch("praisonaippt.gdrive_uploader.time.sleep")
+def test_ensure_folder_path_skips_lookup_under_new_folder(mock_sleep):
+    responses = [
+        {"files": []},
+        {"files": [{"id": "year", "name": "2026", "createdTime": "2026-06-01T08:09:12.000Z"}]},
+        {"files": [{"id": "month", "name": "06", "createdTime": "2026-06-01T08:09:13.000Z"}]},
+    ]
+    uploader, service = _uploader_with_mock_service(responses)
+    service.files.return_value.create.return_value.execute.side_effect = [
+        {"id": "year"}, {"id": "month"},
+    ]
+
+    folder_id, created = uploader.ensure_folder_path("2026/06", parent_id="root-folder")
+
+    assert (folder_id, created) == ("month", True)
+    assert service.files.return_value.list.call_count == 3
+    assert service.files.return_value.create.call_count == 2
+
+
+@patch("praisonaippt.gdrive_uploader.time.sleep")
+def test_ensure_folder_path_looks_up_children_of_older_parallel_folder(mock_sleep):
+    responses = [
+        {"files": []},
+        {"files": [{"id": "theirs"}, {"id": "mine"}]},
+        {"files": [{"id": "their-06"}]},
+    ]
+    uploader, service = _uploader_with_mock_service(responses)
+    service.files.return_value.create.return_value.execute.return_value = {"id": "mine"}
+
+    folder_id, created = uploader.ensure_folder_path("2026/06", parent_id="root-folder")
+
+    assert (folder_id, created) == ("their-06", False)
+    assert service.files.return_value.create.call_count == 1
+    last_query = service.files.return_value.list.call_args.kwargs["q"]
+    assert "'theirs' in parents" in last_query
+
+
+def test_get_or_create_folder_caches_resolved_ids():
+    responses = [{"files": [{"id": "existing", "name": "06", "createdTime": "2026-06-01T08:09:12.000Z"}]}]
+    uploader, service = _uploader_with_mock_service(responses)
+
+    assert uploader.get_or_create_folder("06", parent_id="year") == ("existing", False)
+    assert uploader.get_or_create_folder(" 06 ", parent_id="year") == ("existing", False)
+    assert service.files.return_value.list.call_count == 1
+
+
+class _Resp(dict):
+    """Stand-in for the httplib2 response carried by ``HttpError.resp``."""
+
+    def __init__(self, status, headers=None):
+        super().__init__(headers or {})
+        self.status = status
+
+
+def _http_error(status, retry_after=None):
+    exc = Exception(f"HTTP {status}")
+    exc.resp = _Resp(status, {"retry-after": retry_after} if retry_after else None)
+    return exc
+
+
+def test_upload_files_keeps_order_and_gives_workers_own_service(monkeypatch):
+    uploader = GDriveUploader.__new__(GDriveUploader)
+    uploader.service = object()
+    seen = []
+
+    def fake_upload(self, path, folder_id=None, file_name=None, overwrite=True):
+        seen.append((self is uploader, self.service, threading.current_thread().name))
+        return {"id": path, "parent": folder_id}
+
+    monkeypatch.setattr(GDriveUploader, "upload_file", fake_upload)
+    result = uploader.upload_files(["a", "b", "c"], folder_id="f", max_workers=2)
+
+    assert result == [{"id": p, "parent": "f"} for p in ("a", "b", "c")]
+    assert all(not is_self and service is None for is_self, service, _ in seen)
+
+
+@patch("praisonaippt.gdrive_uploader.time.sleep")
+def test_execute_with_retry_backs_off_on_rate_limit(mock_sleep):
+    from praisonaippt.gdrive_uploader import _execute_with_retry
+
+    request = MagicMock()
+    request.execute.side_effect = [_http_error(429, "3"), _http_error(429), {"id": "ok"}]
+
+    assert _execute_with_retry(request) == {"id": "ok"}
+    assert request.execute.call_count == 3
+    assert mock_sleep.call_args_list[0].args[0] == 3.0
+    assert 2.0 <= mock_sleep.call_args_list[1].args[0] < 3.0
+
+
+@patch("praisonaippt.gdrive_uploader.time.sleep")
+def test_execute_with_retry_retries_server_errors_but_not_client_errors(mock_sleep):
+    from praisonaippt.gdrive_uploader import _execute_with_retry
+
+    request = MagicMock()
+    request.execute.side_effect = [_http_error(503), _http_error(500), {"id": "ok"}]
+    assert _execute_with_retry(request) == {"id": "ok"}
+    assert request.execute.call_count == 3
+
+    request = MagicMock()
+    request.execute.side_effect = _http_error(404)
+    with pytest.raises(Exception, match="HTTP 404"):
+        _execute_with_retry(request)
+    assert request.execute.call_count == 1
+
+
+@patch("praisonaippt.gdrive_uploader.time.sleep")
+def test_create_folder_retries_rate_limits_only(mock_sleep):
+    uploader, service = _uploader_with_mock_service([])
+    create = service.files.return_value.create.return_value
+    create.execute.side_effect = [_http_error(429), {"id": "folder"}]
+    assert uploader.create_folder("06") == "folder"
+
+    create.execute.reset_mock()
+    create.execute.side_effect = [_http_error(503), {"id": "duplicate"}]
+    with pytest.raises(Exception, match="HTTP 503"):
+        uploader.create_folder("06")
+    assert create.execute.call_count == 1
+
+
+@patch("praisonaippt.gdrive_uploader.time.sleep")
+def test_execute_with_retry_gone_ok_accepts_404_after_retry(mock_sleep):
+    from praisonaippt.gdrive_uploader import _execute_with_retry
+
+    request = MagicMock()
+    request.execute.side_effect = [_http_error(502), _http_error(404)]
+    assert _execute_with_retry(request, gone_ok=True) is None
+
+    request = MagicMock()
+    request.execute.side_effect = _http_error(404)
+    with pytest.raises(Exception, match="HTTP 404"):
+        _execute_with_retry(request, gone_ok=True)
+
+
+@patch("praisonaippt.gdrive_uploader.time.sleep")
+def test_folder_lookup_retries_transient_errors(mock_sleep):
+    responses = [_http_error(502), {"files": [{"id": "folder"}]}]
+    uploader, service = _uploader_with_mock_service(responses)
+
+    assert uploader.get_folder_id_by_name("06") == "folder"
+    assert service.files.return_value.list.return_value.execute.call_count == 2
+
+
+def test_execute_with_retry_reraises_other_errors():
+    from praisonaippt.gdrive_uploader import _execute_with_retry
+
+    request = MagicMock()
+    request.execute.side_effect = ValueError("boom")
+    with pytest.raises(ValueError):
+        _execute_with_retry(request)
+    assert request.execute.call_count == 1
+
+
+def test_media_upload_is_resumable_only_above_threshold(monkeypatch, tmp_path):
+    from praisonaippt import gdrive_uploader
+
+    media_file_upload = MagicMock()
+    monkeypatch.setattr(gdrive_uploader, "_media_file_upload", lambda: media_file_upload)
+    uploader = GDriveUploader.__new__(GDriveUploader)
+    uploader.resumable_threshold = 10
+    small = tmp_path / "small.pptx"
+    small.write_bytes(b"x" * 10)
+    large = tmp_path / "large.pptx"
+    large.write_bytes(b"x" * 11)
+
+    uploader._media_upload(str(small), "application/pdf")
+    assert media_file_upload.call_args.kwargs["resumable"] is False
+    assert "chunksize" not in media_file_upload.call_args.kwargs
+    uploader._media_upload(str(large), "application/pdf")
+    assert media_file_upload.call_args.kwargs["resumable"] is True
+    assert media_file_upload.call_args.kwargs["chunksize"] == gdrive_uploader.RESUMABLE_CHUNKSIZE
+
+
+def test_upload_file_stats_once(monkeypatch, tmp_path):
+    from praisonaippt import gdrive_uploader
+
+    monkeypatch.setattr(gdrive_uploader, "_media_file_upload", lambda: MagicMock())
+    uploader = GDriveUploader.__new__(GDriveUploader)
+    uploader.service = MagicMock()
+    uploader.service.files.return_value.create.return_value.execute.return_value = {"id": "f1"}
+    deck = tmp_path / "deck.pptx"
+    deck.write_bytes(b"x" * 3)
+
+    real_stat = os.stat
+    calls = []
+
+    def counting_stat(path, *args, **kwargs):
+        if os.fspath(path) == str(deck):
+            calls.append(path)
+        return real_stat(path, *args, **kwargs)
+
+    monkeypatch.setattr(gdrive_uploader.os, "stat", counting_stat)
+    assert uploader.upload_file(str(deck), overwrite=False) == {"id": "f1"}
+    assert len(calls) == 1
+
+    with pytest.raises(FileNotFoundError, match="File not found"):
+        uploader.upload_file(str(tmp_path / "missing.pptx"))
+
+
+def test_gdrive_module_reports_install_extra():
+    from praisonaippt.gdrive_uploader import _gdrive_module
+    from praisonaippt.lazy_loader import LazyImportError
+
+    with pytest.raises(LazyImportError) as exc_info:
+        _gdrive_module("nonexistent_google_module_xyz")
+    assert exc_info.value.install_extra == "gdrive"
+
+
+def test_get_mime_type_by_extension():
+    assert GDriveUploader._get_mime_type("/tmp/Deck.PPTX") == (
+        "application/vnd.openxmlformats-officedocument.presentationml.presentation"
+    )
+    assert GDriveUploader._get_mime_type("notes.md") == "text/markdown"
+    assert GDriveUploader._get_mime_type("archive.tar.gz") == "application/octet-stream"
+
+
+def test_get_service_builds_once_with_authorized_http(monkeypatch):
+    from praisonaippt import gdrive_uploader
+
+    modules = {"httplib2": MagicMock(), "google_auth_httplib2": MagicMock()}
+    build = MagicMock()
+    monkeypatch.setattr(gdrive_uploader, "_gdrive_module", modules.__getitem__)
+    monkeypatch.setattr(gdrive_uploader, "_build", lambda: build)
+    uploader = GDriveUploader.__new__(GDriveUploader)
+    uploader.credentials = object()
+    uploader.service = None
+
+    assert uploader._get_service() is uploader._get_service()
+    build.assert_called_once()
+    kwargs = build.call_args.kwargs
+    assert kwargs["cache_discovery"] is False
+    assert kwargs["static_discovery"] is True
+    assert kwargs["http"] is modules["google_auth_httplib2"].AuthorizedHttp.return_value
+    modules["httplib2"].Http.assert_called_once_with(timeout=gdrive_uploader.HTTP_TIMEOUT_SEC)
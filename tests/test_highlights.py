@@ -0,0 +1,67 @@
+"""Tests for per-phrase highlight runs in verse paragraphs."""
+
+import pytest
+from pptx import Presentation
+from pptx.util import Inches
+
+from praisonaippt.core import _apply_highlights
+
+
+def _paragraph():
+    prs = Presentation()
+    slide = prs.slides.add_slide(prs.slide_layouts[6])
+    tb = slide.shapes.add_textbox(Inches(1), Inches(1), Inches(6), Inches(2))
+    return tb.text_frame.paragraphs[0]
+
+
+def _run_texts(p):
+    return [r.text for r in p.runs]
+
+
+def test_highlights_split_runs_case_insensitive():
+    p = _paragraph()
+    _apply_highlights(p, "For God so loved the world", ["god", "WORLD"])
+    assert _run_texts(p) == ["For ", "God", " so loved the ", "world"]
+    assert p.runs[1].font.bold is True
+
+
+def test_overlapping_highlights_earlier_phrase_wins():
+    p = _paragraph()
+    _apply_highlights(p, "grace of God", ["grace", "grace of God", "of God"])
+    assert _run_texts(p) == ["grace", " ", "of God"]
+
+
+def test_large_text_and_no_match():
+    p = _paragraph()
+    _apply_highlights(p, "Be still and know", None, {"still": 60})
+    assert _run_texts(p) == ["Be ", "still", " and know"]
+    assert p.runs[1].font.size.pt == 60
+
+    p = _paragraph()
+    _apply_highlights(p, "Be still and know", ["absent"])
+    assert _run_texts(p) == ["Be still and know"]
+
+
+def test_annotation_run_and_placement_before_end_para_rpr():
+    p = _paragraph()
+    p._p.get_or_add_endParaRPr()
+    _apply_highlights(p, "He is risen", [{"text": "risen", "annotation": 1, "italic": True}],
+                      font_name="Georgia")
+    assert _run_texts(p) == ["He is ", "risen", "\u2776"]
+    risen, bubble = p.runs[1], p.runs[2]
+    assert risen.font.italic is True and risen.font.underline is True
+    assert risen.font.name == "Georgia"
+    assert bubble._r.rPr.get("baseline") == "30000"
+    assert p._p[-1].tag.endswith("endParaRPr")
+
+
+def test_aho_corasick_spans_match_regex_spans(monkeypatch):
+    pytest.importorskip("ahocorasick")
+    from praisonaippt import core
+
+    phrases = ("grace", "grace of god", "of god", "GOD", "the", "love",
+               "loved", "world", "so", "for")
+    text = "For God so loved the world, by the grace of God."
+    fast = list(core._find_phrase_spans(text, phrases))
+    monkeypatch.setattr(core, "_ahocorasick", None)
+    assert fast == list(core._find_phrase_spans(text, phrases))
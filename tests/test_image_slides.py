@@ -90,3 +90,54 @@ def test_create_presentation_with_image_slide(tmp_path):
         s.shape_type == 13 for s in prs.slides[1].shapes
     )
     assert has_picture
+
+
+@pytest.mark.skipif(not SAMPLE_IMAGE.is_file(), reason="sample image missing")
+def test_background_image_shared_across_slides(tmp_path):
+    from pptx import Presentation
+
+    data = load_verses_from_dict(
+        {
+            "presentation_title": "Backgrounds",
+            "slide_style": {"background_image": str(SAMPLE_IMAGE)},
+            "sections": [
+                {
+                    "section": "S",
+                    "verses": [
+                        {"reference": "John 1:1", "text": "In the beginning was the Word"},
+                        {"reference": "John 1:2", "text": "The same was in the beginning"},
+                    ],
+                }
+            ],
+        }
+    )
+    out = tmp_path / "bg.pptx"
+    assert create_presentation(data, output_file=str(out)) == str(out)
+
+    prs = Presentation(str(out))
+    image_parts = set()
+    for slide in prs.slides:
+        first = list(slide.shapes)[0]
+        assert first.shape_type == 13  # MSO_SHAPE_TYPE.PICTURE, behind the text
+        ids = [shape.shape_id for shape in slide.shapes]
+        assert len(ids) == len(set(ids))
+        image_parts.add(first.image.sha1)
+    assert len(prs.slides) == 4
+    assert len(image_parts) == 1
+
+
+def test_missing_image_logs_warning(tmp_path, caplog):
+    data = {
+        "presentation_title": "Missing image",
+        "sections": [
+            {
+                "section": "",
+                "verses": [{"slide_type": "image", "image_path": "does/not/exist.png"}],
+            }
+        ],
+    }
+    out = tmp_path / "missing.pptx"
+    with caplog.at_level("WARNING", logger="praisonaippt.core"):
+        create_presentation(load_verses_from_dict(data), output_file=str(out))
+    assert out.is_file()
+    assert "Image not found: does/not/exist.png" in caplog.text
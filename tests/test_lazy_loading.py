@@ -2,6 +2,8 @@
 Tests for lazy loading functionality.
 """
 
+import os
+
 import pytest
 from praisonaippt.lazy_loader import (
     lazy_import,
@@ -102,5 +104,50 @@ def test_lazy_loader_no_premature_import():
     assert 'urllib.parse' in sys.modules
 
 
+def test_cli_import_does_not_load_pptx():
+    """Importing the CLI should not pull in python-pptx or the Drive uploader."""
+    import subprocess
+    import sys
+
+    code = (
+        "import sys, praisonaippt, praisonaippt.cli; "
+        "assert 'pptx' not in sys.modules; "
+        "assert 'praisonaippt.gdrive_uploader' not in sys.modules; "
+        "praisonaippt.create_presentation; "
+        "assert 'pptx' in sys.modules"
+    )
+    env = {k: v for k, v in os.environ.items() if k != "PRAISONAIPPT_EAGER_IMPORT"}
+    subprocess.run([sys.executable, "-c", code], check=True, env=env)
+
+
+def test_pptx_to_json_export_survives_submodule_import():
+    """Importing the same-named submodule must not replace the exported function."""
+    import subprocess
+    import sys
+
+    code = (
+        "import praisonaippt.pptx_to_json, praisonaippt; "
+        "from praisonaippt import pptx_to_json; "
+        "assert callable(praisonaippt.pptx_to_json); "
+        "assert callable(pptx_to_json)"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_eager_import_env_resolves_lazy_exports():
+    """PRAISONAIPPT_EAGER_IMPORT=1 should import every lazy export up front."""
+    import subprocess
+    import sys
+
+    code = (
+        "import sys, praisonaippt; "
+        "assert 'pptx' in sys.modules; "
+        "assert 'praisonaippt.gdrive_uploader' in sys.modules; "
+        "assert 'GDriveUploader' in vars(praisonaippt)"
+    )
+    env = dict(os.environ, PRAISONAIPPT_EAGER_IMPORT="1")
+    subprocess.run([sys.executable, "-c", code], check=True, env=env)
+
+
 if __name__ == '__main__':
     pytest.main([__file__, '-v'])
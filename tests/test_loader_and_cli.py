@@ -120,3 +120,79 @@ def test_cli_convert_json_yaml_to_json_validates(tmp_path):
     )
     assert result.returncode != 0
     assert "invalid schema" in (result.stdout + result.stderr).lower()
+
+
+def test_load_deck_mapping_json_without_orjson(monkeypatch, tmp_path):
+    from praisonaippt import loader
+
+    monkeypatch.setattr(loader, "_orjson", None)
+    deck = tmp_path / "deck.json"
+    deck.write_text(
+        json.dumps({"presentation_title": "T", "sections": []}), encoding="utf-8",
+    )
+    assert loader.load_deck_mapping(deck)["presentation_title"] == "T"
+
+    bad = tmp_path / "bad.json"
+    bad.write_text("{not valid json", encoding="utf-8")
+    with pytest.raises(json.JSONDecodeError):
+        loader.load_deck_mapping(bad)
+
+
+def test_load_deck_mapping_cache_returns_copies_and_sees_edits(tmp_path):
+    from praisonaippt.loader import load_deck_mapping
+
+    deck = tmp_path / "deck.yaml"
+    deck.write_text("presentation_title: First\nsections: []\n", encoding="utf-8")
+    first = load_deck_mapping(deck)
+    first["presentation_title"] = "Mutated"
+    assert load_deck_mapping(deck)["presentation_title"] == "First"
+
+    deck.write_text("presentation_title: Second title\nsections: []\n", encoding="utf-8")
+    assert load_deck_mapping(deck)["presentation_title"] == "Second title"
+
+
+def test_load_deck_mapping_caches_yaml_but_reparses_json(monkeypatch, tmp_path):
+    from praisonaippt import loader
+
+    parses = []
+    real_parse = loader._parse_deck_file
+
+    def counting_parse(file_path, size):
+        parses.append(file_path.suffix)
+        return real_parse(file_path, size)
+
+    monkeypatch.setattr(loader, "_parse_deck_file", counting_parse)
+    yaml_deck = tmp_path / "deck.yaml"
+    yaml_deck.write_text("presentation_title: Y\nsections: []\n", encoding="utf-8")
+    json_deck = tmp_path / "deck.json"
+    json_deck.write_text('{"presentation_title": "J", "sections": []}', encoding="utf-8")
+
+    first = loader.load_deck_mapping(yaml_deck)
+    second = loader.load_deck_mapping(yaml_deck)
+    assert first == second and first is not second
+    assert first["sections"] is not second["sections"]
+    loader.load_deck_mapping(json_deck)
+    loader.load_deck_mapping(json_deck)
+    assert parses == [".yaml", ".json", ".json"]
+
+
+def test_scan_examples_prefers_yaml_and_ignores_other_files(tmp_path):
+    from praisonaippt.loader import _scan_examples
+
+    for name in ("a.json", "a.yaml", "b.yml", "b.json", "c.json", "notes.txt"):
+        (tmp_path / name).write_text("{}", encoding="utf-8")
+    (tmp_path / "d.yaml").mkdir()
+    mtime = tmp_path.stat().st_mtime_ns
+    assert _scan_examples(str(tmp_path), mtime) == ("a.yaml", "b.yml", "c.json")
+
+
+def test_load_deck_mapping_memory_maps_large_json(monkeypatch, tmp_path):
+    pytest.importorskip("orjson")
+    from praisonaippt import loader
+
+    monkeypatch.setattr(loader, "JSON_MMAP_MIN_BYTES", 1)
+    deck = tmp_path / "big.json"
+    deck.write_text(
+        json.dumps({"presentation_title": "Mapped", "sections": []}), encoding="utf-8",
+    )
+    assert loader.load_deck_mapping(deck)["presentation_title"] == "Mapped"
@@ -0,0 +1,145 @@
+"""Tests for python-pptx packaging helpers in ``praisonaippt.core``."""
+
+import os
+import stat
+
+import pytest
+from pptx import Presentation
+
+from praisonaippt import create_presentation, load_verses_from_dict
+
+
+def _deck(n_verses):
+    return load_verses_from_dict(
+        {
+            "presentation_title": "Packaging",
+            "sections": [
+                {
+                    "section": "S",
+                    "verses": [
+                        {"reference": f"Ps 23:{i}", "text": f"Verse {i}", "notes": f"Note {i}"}
+                        for i in range(1, n_verses + 1)
+                    ],
+                }
+            ],
+        }
+    )
+
+
+def test_notes_slide_partnames_unique(tmp_path):
+    out = tmp_path / "notes.pptx"
+    create_presentation(_deck(12), output_file=str(out))
+
+    prs = Presentation(str(out))
+    notes_parts = [
+        str(slide.notes_slide.part.partname) for slide in prs.slides if slide.has_notes_slide
+    ]
+    assert len(notes_parts) == 12
+    assert len(set(notes_parts)) == 12
+    assert notes_parts[0] == "/ppt/notesSlides/notesSlide1.xml"
+
+
+def test_partname_counter_skips_parts_already_in_package(tmp_path):
+    first = tmp_path / "first.pptx"
+    create_presentation(_deck(3), output_file=str(first))
+
+    prs = Presentation(str(first))
+    slide = prs.slides.add_slide(prs.slide_layouts[6])
+    assert str(slide.notes_slide.part.partname) == "/ppt/notesSlides/notesSlide4.xml"
+
+
+def test_saved_deck_stores_media_and_deflates_xml(tmp_path):
+    import zipfile
+    from pathlib import Path
+
+    image = Path(__file__).resolve().parent.parent / "assets" / "background_alt.jpg"
+    data = _deck(2)
+    data["slide_style"] = {"background_image": str(image)}
+    out = tmp_path / "zip.pptx"
+    create_presentation(data, output_file=str(out))
+
+    with zipfile.ZipFile(out) as zf:
+        infos = {info.filename: info for info in zf.infolist()}
+        assert zf.testzip() is None
+    media = [i for name, i in infos.items() if name.startswith("ppt/media/")]
+    assert media and all(i.compress_type == zipfile.ZIP_STORED for i in media)
+    assert infos["ppt/slides/slide1.xml"].compress_type == zipfile.ZIP_DEFLATED
+    assert len(Presentation(str(out)).slides) == 4
+
+
+def test_create_presentations_builds_decks_in_order(tmp_path):
+    from praisonaippt import create_presentations
+
+    jobs = [(_deck(n), str(tmp_path / f"deck{n}.pptx")) for n in (1, 2, 3)]
+    assert create_presentations(jobs, max_workers=2) == [out for _, out in jobs]
+    assert [len(Presentation(out).slides) for _, out in jobs] == [3, 4, 5]
+
+
+def test_failed_save_keeps_previous_deck_and_removes_temp_file(tmp_path):
+    from praisonaippt.core import _save_presentation
+
+    out = tmp_path / "deck.pptx"
+    out.write_bytes(b"previous")
+
+    class Boom(Exception):
+        pass
+
+    class BrokenPresentation:
+        def save(self, f):
+            f.write(b"partial")
+            raise Boom()
+
+    with pytest.raises(Boom):
+        _save_presentation(BrokenPresentation(), str(out))
+    assert out.read_bytes() == b"previous"
+    assert list(tmp_path.iterdir()) == [out]
+
+    _save_presentation(Presentation(), str(out))
+    assert len(Presentation(str(out)).slides) == 0
+    assert list(tmp_path.iterdir()) == [out]
+
+
+@pytest.mark.skipif(os.name != "posix", reason="POSIX permission bits")
+def test_save_keeps_existing_mode_and_uses_unique_temp_files(tmp_path, monkeypatch):
+    from praisonaippt import core
+
+    out = tmp_path / "deck.pptx"
+    out.write_bytes(b"previous")
+    os.chmod(out, 0o640)
+    core._save_presentation(Presentation(), str(out))
+    assert stat.S_IMODE(os.stat(out).st_mode) == 0o640
+
+    names = []
+    real_open_temp = core._open_save_temp
+
+    def recording_open_temp(output_file):
+        tmp_file, f = real_open_temp(output_file)
+        names.append(tmp_file)
+        return tmp_file, f
+
+    monkeypatch.setattr(core, "_open_save_temp", recording_open_temp)
+    core._save_presentation(Presentation(), str(out))
+    core._save_presentation(Presentation(), str(out))
+    assert len(set(names)) == 2
+    assert all(os.path.dirname(n) == str(tmp_path) for n in names)
+
+
+@pytest.mark.skipif(os.name != "posix", reason="POSIX permission bits")
+def test_save_new_deck_gets_umask_default_and_skips_taken_temp_names(tmp_path, monkeypatch):
+    from praisonaippt import core
+
+    out = tmp_path / "deck.pptx"
+    taken = tmp_path / ".deck.pptx.aaaa.tmp"
+    taken.write_bytes(b"someone else's")
+    tokens = iter(["aaaa", "bbbb"])
+    monkeypatch.setattr(core.secrets, "token_hex", lambda n: next(tokens))
+
+    old_umask = os.umask(0o027)
+    try:
+        core._save_presentation(Presentation(), str(out))
+    finally:
+        os.umask(old_umask)
+
+    assert stat.S_IMODE(os.stat(out).st_mode) == 0o640
+    assert taken.read_bytes() == b"someone else's"
+    assert sorted(p.name for p in tmp_path.iterdir()) == [taken.name, out.name]
@@ -86,3 +86,28 @@ def test_custom_renderer_registration():
     register_renderer(_QuoteRenderer())
     assert get_renderer("quote_test") is not None
     assert resolve_renderer({"slide_type": "quote_test"}).kind == "quote_test"
+
+
+def test_video_slide_plan_matches_rendered_verse_slides(tmp_path):
+    from pptx import Presentation
+
+    from praisonaippt import create_presentation, load_verses_from_dict
+    from praisonaippt.video_exporter import iter_slide_plan
+
+    text = " ".join(f"Word{i} and more words here." for i in range(20))
+    data = load_verses_from_dict({
+        "presentation_title": "Split",
+        "skip_title_slide": True,
+        "slide_style": {"split_max_length": 200},
+        "sections": [{"verses": [
+            {"reference": "A 1:1", "text": text, "slide_style": {"split_max_length": 60}},
+            {"reference": "A 1:2", "text": text},
+        ]}],
+    })
+    out = tmp_path / "deck.pptx"
+    create_presentation(data, output_file=str(out))
+
+    plan = list(iter_slide_plan(data))
+    assert len(plan) == len(Presentation(str(out)).slides)
+    per_verse = [sum(1 for e in plan if e["verse"]["reference"] == ref) for ref in ("A 1:1", "A 1:2")]
+    assert per_verse[0] > per_verse[1]
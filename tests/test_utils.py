@@ -0,0 +1,24 @@
+"""Tests for text and filename helpers in ``praisonaippt.utils``."""
+
+from praisonaippt.utils import sanitize_filename, split_long_text
+
+
+def test_split_long_text_short_text_unchanged():
+    assert split_long_text("In the beginning.", max_length=200) == ["In the beginning."]
+
+
+def test_split_long_text_breaks_at_sentences():
+    text = "First sentence here. Second one here! Third question here? Fourth."
+    parts = split_long_text(text, max_length=24)
+    assert parts == [
+        "First sentence here.", "Second one here!", "Third question here?", "Fourth.",
+    ]
+
+
+def test_split_long_text_keeps_oversized_sentence_whole():
+    text = "x" * 60 + ". Short."
+    assert split_long_text(text, max_length=20) == ["x" * 60 + ".", "Short."]
+
+
+def test_sanitize_filename():
+    assert sanitize_filename('My: "Deck"/v2?  ') == "My_Deckv2"